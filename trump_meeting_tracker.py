@@ -8,9 +8,18 @@ import os
 import json
 import sqlite3
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Dict, Optional, Tuple
 import re
+import io
+import mmap
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+from bisect import bisect_right
+from functools import lru_cache
+from contextlib import contextmanager
 
 # Load environment variables from .env file
 try:
@@ -20,6 +29,20 @@ except ImportError:
     # dotenv not installed, environment variables must be set manually
     pass
 
+# Optional on-disk HTTP cache for repeated runs (ENABLE_HTTP_CACHE=true)
+try:
+    import requests_cache
+except ImportError:
+    # requests-cache not installed, every run fetches from the network
+    requests_cache = None
+
+# Faster decoding of the attendee JSON list columns when orjson is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # orjson not installed, fall back to the stdlib decoder
+    from json import loads as _json_loads
+
 # News APIs
 from newsapi import NewsApiClient
 import feedparser
@@ -37,29 +60,392 @@ from collections import Counter
 import base64
 
 
+# Precompiled regex patterns used when parsing articles
+_DATE_PATTERNS = [
+    re.compile(r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'),
+    re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),
+    re.compile(r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}')
+]
+
+# Name, Title of Company - e.g. "Andy Jassy, CEO of Amazon"
+_ATTENDEE_PAT1 = re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s+(CEO|Chairman|Chief\s+Executive|Chief\s+Operating\s+Officer|CFO|COO|Chief\s+Financial\s+Officer|President|Founder|Co-Founder|Managing\s+Director|Executive\s+Chairman)\s+(?:of\s+|at\s+)([A-Z][A-Za-z0-9\s&\.]+?)(?:\.|,|\s+(?:said|told|announced|met|joined|attended))')
+
+# Company Title Name - e.g. "Amazon CEO Andy Jassy", "Intel CEO Lip-Bu Tan"
+_ATTENDEE_PAT2 = re.compile(r'([A-Z][A-Za-z0-9]+(?:\s+[A-Z&][A-Za-z0-9]+){0,2})\s+(CEO|Chairman|Chief\s+Executive|President|Founder|Co-Founder|Managing\s+Director|Executive\s+Chairman)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+)')
+
+# Company Title without a name - e.g. "Trump meets Intel CEO"
+_COMPANY_CEO_PAT = re.compile(r'(?:meets|met|hosted|host|meeting\s+with)\s+(?:with\s+)?([A-Z][A-Za-z0-9]+(?:\s+[A-Z&][A-Za-z0-9]+){0,2})\s+(CEO|Chairman|Chief\s+Executive|President)')
+
+# Two or three capitalized words, may be hyphenated - e.g. "Lip-Bu Tan"
+_PERSON_NAME_PAT = re.compile(r'\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b')
+
+# Keywords for is_trump_meeting_article. Plain substring tests are deliberate:
+# CPython's `in` beats a combined regex alternation on article-sized text.
+_MEETING_PATTERNS = (
+    'trump meet', 'trump met', 'trump host', 'trump welcomed',
+    'meeting with trump', 'met with trump', 'hosted by trump'
+)
+_BUSINESS_WORDS = (
+    'ceo', 'chief executive', 'chairman', 'chief', 'business leader',
+    'executive', 'company', 'founder', 'entrepreneur', 'businessman',
+    'businesswoman', 'tech', 'corporation', 'industry', 'corporate',
+    'investor', 'billionaire', 'magnate'
+)
+_POLITICAL_KEYWORDS = (
+    'ukraine', 'russia', 'venezuela', 'maduro', 'macron', 'zelensky', 'iran',
+    'foreign leader', 'prime minister', 'nato', 'invasion', 'military',
+    'war', 'sanctions', 'diplomacy', 'treaty', 'ambassador'
+)
+
+# Corporate suffixes stripped from company names
+_COMPANY_SUFFIX_PAT = re.compile(r'\s+Inc\.?|\s+Corp\.?|\s+LLC|\s+Ltd\.?')
+
+# Government/political keywords and countries that mean a "company" match
+# is really a government entity. Matched as plain substrings (no word
+# boundaries), in one scan of the short company name.
+_GOVERNMENT_KEYWORDS = (
+    'national assembly', 'government', 'ministry', 'parliament', 'congress',
+    'senate', 'administration', 'department of', 'agency', 'commission',
+    'federal', 'state department', 'white house', 'embassy', 'consulate',
+    'republic', 'kingdom', 'federation', 'union', 'nation', 'country',
+    'military', 'army', 'navy', 'defense', 'homeland security',
+    'foreign affairs', 'state', 'democratic', 'republic of',
+    'united states', 'european union', 'nato', 'un ', 'u.n.'
+)
+_COUNTRIES = (
+    'venezuela', 'france', 'ukraine', 'russia', 'iran', 'mexico', 'colombia',
+    'denmark', 'greenland', 'china', 'israel', 'syria', 'iraq', 'afghanistan',
+    'canada', 'britain', 'germany', 'italy', 'spain', 'poland', 'japan',
+    'korea', 'brazil', 'argentina', 'egypt', 'turkey', 'india', 'pakistan',
+    'saudi arabia', 'united arab emirates', 'qatar', 'taiwan', 'vietnam',
+    'thailand', 'indonesia', 'australia', 'new zealand', 'south africa'
+)
+_GOVERNMENT_OR_COUNTRY_PAT = re.compile(
+    '|'.join(re.escape(keyword) for keyword in _GOVERNMENT_KEYWORDS + _COUNTRIES)
+)
+
+# Single-word nationality adjectives that aren't companies on their own
+_NATIONALITY_ADJECTIVES = frozenset({
+    'danish', 'venezuelan', 'colombian', 'mexican', 'iranian', 'french',
+    'canadian', 'british', 'german', 'italian', 'spanish', 'japanese',
+    'korean', 'chinese', 'russian', 'ukrainian', 'israeli', 'egyptian'
+})
+
+# Meeting locations in priority order with the phrases that identify them.
+# Substring tests here: a combined regex alternation is far slower than
+# `in` on article-length text.
+_LOCATIONS = (
+    ('Mar-a-Lago', ('mar-a-lago', 'mar a lago')),
+    ('White House, DC', ('white house',)),
+    ('Trump Tower, NY', ('trump tower',)),
+    ('Bedminster, NJ', ('bedminster',))
+)
+
+# Words that mark a capitalized phrase as something other than a person's name
+_NON_NAME_WORDS = frozenset({
+    'president', 'ceo', 'chairman', 'chief', 'executive', 'officer',
+    'company', 'corporation', 'inc', 'llc', 'ltd', 'business',
+    'administration', 'department', 'agency', 'house', 'senate',
+    'heritage', 'foundation', 'project', 'act', 'services', 'education',
+    'disabilities', 'human', 'armed', 'vocational', 'aptitude', 'battery',
+    'head', 'start', 'reproductive', 'freedom', 'health', 'resources',
+    'secretary', 'robert', 'alive', 'abortion', 'survivors', 'medicaid',
+    'homeland', 'security', 'border', 'protection', 'customs', 'enforcement',
+    'national', 'weather', 'service', 'fair', 'labor', 'standards',
+    'supreme', 'court', 'civil', 'war', 'white', 'donald', 'trump',
+    # Technical/manufacturing terms
+    'made', 'sub', 'nanometer', 'chip', 'western', 'hemisphere', 'insanity',
+    'rules', 'united', 'states', 'north', 'south', 'east', 'west', 'new', 'york'
+})
+
+
+def _char_ngrams(text: str, n: int = 4) -> frozenset:
+    """Set of all n-character substrings of text (empty if text is shorter than n)"""
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def _findall_batch(pattern: re.Pattern, texts: List[str]) -> List[List[Tuple]]:
+    """
+    pattern.findall() over each text, using a single scan of the texts
+    joined by NUL (the attendee patterns can't match across a NUL)
+    """
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+
+    results = [[] for _ in texts]
+    for match in pattern.finditer('\x00'.join(texts)):
+        results[bisect_right(starts, match.start()) - 1].append(match.groups())
+    return results
+
+
+@lru_cache(maxsize=256)
+def _person_company_patterns(person_name: str):
+    """
+    Compile the patterns that find a person's company
+    Returns (article context patterns, web search result patterns)
+    """
+    name = re.escape(person_name)
+    company_title_name = re.compile(
+        f"([A-Z][A-Za-z0-9]+(?:\\s+[A-Z][A-Za-z0-9]+)?)\\s+(?:CEO|President|Chairman)\\s+{name}", re.IGNORECASE)
+    context_patterns = (
+        re.compile(f"{name}[^.]*?(?:CEO|President|Chairman|Chief Executive)[^.]*?(?:of|at)\\s+([A-Z][A-Za-z0-9]+(?:\\s+[A-Z][A-Za-z0-9]+)?)", re.IGNORECASE),
+        company_title_name
+    )
+    search_patterns = (
+        re.compile(f"{name}[^.]*?(?:CEO|President|Chairman)[^.]*?(?:of|at)\\s+([A-Z][A-Za-z0-9]+(?:\\s+[A-Z][A-Za-z0-9]+)?)", re.IGNORECASE),
+        company_title_name
+    )
+    return context_patterns, search_patterns
+
+
+@lru_cache(maxsize=256)
+def _company_ceo_patterns(company_name: str):
+    """Compile the patterns that find a company's CEO"""
+    company = re.escape(company_name)
+    return (
+        re.compile(f"{company}\\s+CEO\\s+([A-Z][a-z]+\\s+[A-Z][a-z]+)", re.IGNORECASE),
+        re.compile(f"([A-Z][a-z]+\\s+[A-Z][a-z]+),\\s+(?:CEO|Chief Executive|Chief Executive Officer)\\s+(?:of|at)\\s+{company}", re.IGNORECASE),
+        re.compile(f"([A-Z][a-z]+\\s+[A-Z][a-z]+)\\s+is\\s+(?:the\\s+)?CEO\\s+(?:of|at)\\s+{company}", re.IGNORECASE)
+    )
+
+
+# Attendee columns returned by the meeting loaders: the summary set used by
+# the email, and the full set (JSON list fields decoded) used by the Excel report
+ATTENDEE_SUMMARY_COLUMNS = ('id', 'meeting_id', 'name', 'title', 'company', 'primary_industry', 'confidence_level')
+ATTENDEE_COLUMNS = ('id', 'meeting_id', 'name', 'title', 'company', 'primary_industry', 'secondary_industries',
+                    'confidence_level', 'confidence_reasons', 'requires_review')
+
+# Concurrent NewsAPI/RSS fetches shared by all sources in one search run
+FETCH_WORKERS = 12
+
+# HTTP response cache used when ENABLE_HTTP_CACHE=true: NewsAPI results are
+# reused for an hour, feeds and scraped articles for 10 minutes
+HTTP_CACHE_PATH = 'http_cache.sqlite'
+HTTP_CACHE_EXPIRE_AFTER = 600
+HTTP_CACHE_URLS_EXPIRE_AFTER = {'newsapi.org': 3600}
+
+# Feed element names, as ElementTree spells namespaced tags
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_RSS1 = '{http://purl.org/rss/1.0/}'
+_CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+_DCTERMS_ISSUED = '{http://purl.org/dc/terms/}issued'
+_FEED_ITEM_TAGS = ('item', _RSS1 + 'item', _ATOM + 'entry')
+_FEED_TITLE_PARENTS = ('channel', _RSS1 + 'channel', _ATOM + 'feed')
+
+
+def _feed_datetime(value: str) -> Optional[datetime]:
+    """Parse an RSS (RFC 822) or Atom (ISO 8601) date to naive UTC, None if unparseable"""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.replace(microsecond=0)
+
+
+def _feed_text(item: ET.Element, *tags: str) -> str:
+    """Stripped text of the first of tags present on item"""
+    for tag in tags:
+        value = item.findtext(tag)
+        if value:
+            return value.strip()
+    return ''
+
+
+def _feed_link(item: ET.Element) -> str:
+    """RSS <link> text, or the href of an Atom alternate link"""
+    link = _feed_text(item, 'link', _RSS1 + 'link')
+    if link:
+        return link
+    for atom_link in item.iter(_ATOM + 'link'):
+        if atom_link.get('rel', 'alternate') == 'alternate':
+            return atom_link.get('href', '').strip()
+    return ''
+
+
+def _parse_feed_xml(content: bytes) -> Tuple[Optional[str], List[Dict]]:
+    """
+    Stream-parse an RSS 2.0 / RSS 1.0 / Atom document
+    Returns (feed title, entries); entries carry title, summary, link,
+    published (raw string) and published_dt (naive UTC datetime or None)
+    Raises ET.ParseError for documents that aren't well-formed XML
+    """
+    feed_title = None
+    entries = []
+    parents = []
+
+    for event, elem in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+        if event == 'start':
+            parents.append(elem.tag)
+            continue
+        parents.pop()
+
+        if elem.tag in _FEED_ITEM_TAGS:
+            # Same fields feedparser would give: summary falls back to full
+            # content, and only publish dates (not updated/dc:date) count
+            published = _feed_text(elem, 'pubDate', _ATOM + 'published', _DCTERMS_ISSUED)
+            entries.append({
+                'title': _feed_text(elem, 'title', _RSS1 + 'title', _ATOM + 'title'),
+                'summary': _feed_text(elem, 'description', _RSS1 + 'description', _ATOM + 'summary',
+                                      _CONTENT_ENCODED, _ATOM + 'content'),
+                'link': _feed_link(elem),
+                'published': published,
+                'published_dt': _feed_datetime(published)
+            })
+            elem.clear()
+        elif (feed_title is None and elem.tag in ('title', _RSS1 + 'title', _ATOM + 'title')
+              and parents and parents[-1] in _FEED_TITLE_PARENTS):
+            feed_title = (elem.text or '').strip()
+
+    return feed_title, entries
+
+
+def _parse_feed(content: bytes) -> Tuple[Optional[str], List[Dict]]:
+    """Parse feed bytes, falling back to feedparser for malformed XML"""
+    try:
+        return _parse_feed_xml(content)
+    except ET.ParseError:
+        pass
+
+    # feedparser copes with broken markup and HTML entities ET rejects
+    feed = feedparser.parse(content)
+    entries = []
+    for entry in feed.entries:
+        try:
+            published_dt = datetime(*entry.published_parsed[:6])
+        except (AttributeError, TypeError, ValueError):
+            published_dt = None
+        entries.append({
+            'title': entry.get('title', ''),
+            'summary': entry.get('summary', ''),
+            'link': entry.get('link', ''),
+            'published': entry.get('published', ''),
+            'published_dt': published_dt
+        })
+    return feed.feed.get('title'), entries
+
+
+# HTML-escape table for article-sourced text in the email report (same mapping as html.escape)
+_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+
+def _e(value) -> str:
+    """Escape a value for interpolation into report HTML text or attributes"""
+    return str(value).translate(_ESC)
+
+
+# Excel styles shared by every report row instead of rebuilt per cell
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="0F1F2E", end_color="0F1F2E", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+FILL_HIGH = PatternFill(start_color="D1FAE5", end_color="D1FAE5", fill_type="solid")
+FILL_MED = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
+FILL_LOW = PatternFill(start_color="FEE2E2", end_color="FEE2E2", fill_type="solid")
+FILL_BY_CONF = {'high': FILL_HIGH, 'medium': FILL_MED, 'low': FILL_LOW}
+BOLD = Font(bold=True)
+BOLD_12 = Font(bold=True, size=12, color="0F1F2E")
+BOLD_14 = Font(bold=True, size=14, color="0F1F2E")
+BOLD_16 = Font(bold=True, size=16, color="0F1F2E")
+FILL_SUMMARY = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
+
+
+def _put(sheet, row: int, column: int, value, font: Font = None, fill: PatternFill = None):
+    """Set a cell by row/column index (no A1 coordinate parsing) and optionally style it"""
+    cell = sheet.cell(row=row, column=column, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    return cell
+
+
+# SendGrid accepts at most 1000 recipients per message
+SENDGRID_MAX_RECIPIENTS = 1000
+
+# Attachments at least this large are base64-encoded from a memory map instead of a read() copy
+ATTACHMENT_MMAP_THRESHOLD = 10 * 1024 * 1024
+
+# Shared SendGrid client, created on first send and reused afterwards
+_sendgrid_client = None
+
+
+def _get_sendgrid_client(api_key: str) -> SendGridAPIClient:
+    """Return the shared SendGrid client, creating it if needed"""
+    global _sendgrid_client
+    if _sendgrid_client is None or _sendgrid_client.api_key != api_key:
+        _sendgrid_client = SendGridAPIClient(api_key)
+    return _sendgrid_client
+
+
+# Industries that make a meeting high/medium priority in the email report
+PRIORITY_INDUSTRIES = frozenset({
+    '3PL', 'Asian 3PL', 'Agriculture', 'Automotive', 'Building Materials',
+    'Data Center', 'E-Commerce', 'Asian E-Commerce', 'Food & Beverage',
+    'Fulfillment & Packaging', 'Life Sciences', 'Manufacturing',
+    'Powered Land', 'Retail', 'Wholesaler', 'Cold Storage'
+})
+
+
 class TrumpMeetingsTracker:
     def __init__(self, db_path='trump_meetings.db', config_path='data_sources_config.json'):
         self.db_path = db_path
         self.config_path = config_path
         self.config = self.load_config()
+        self.build_industry_index()
         self.init_database()
         
+        # Shared HTTP session so NewsAPI and RSS fetches reuse pooled connections
+        self.http = self.create_http_session()
+        adapter = HTTPAdapter(pool_maxsize=FETCH_WORKERS)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+
         # Initialize NewsAPI client
         self.newsapi_key = os.environ.get('NEWS_API_KEY')
         if self.newsapi_key:
-            self.newsapi = NewsApiClient(api_key=self.newsapi_key)
+            self.newsapi = NewsApiClient(api_key=self.newsapi_key, session=self.http)
         else:
             self.newsapi = None
             print("⚠️ NEWS_API_KEY not set - NewsAPI searches will be skipped")
         
+    def create_http_session(self) -> requests.Session:
+        """Create the shared HTTP session, backed by an on-disk cache if enabled"""
+        if os.environ.get('ENABLE_HTTP_CACHE', 'false').lower() == 'true':
+            if requests_cache is not None:
+                return requests_cache.CachedSession(
+                    HTTP_CACHE_PATH,
+                    backend='sqlite',
+                    expire_after=HTTP_CACHE_EXPIRE_AFTER,
+                    urls_expire_after=HTTP_CACHE_URLS_EXPIRE_AFTER,
+                    allowable_methods=('GET',)
+                )
+            print("⚠️ ENABLE_HTTP_CACHE set but requests-cache is not installed - HTTP caching disabled")
+        return requests.Session()
+
     def load_config(self):
         """Load configuration from JSON file"""
         with open(self.config_path, 'r') as f:
             return json.load(f)
     
     def init_database(self):
-        """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
+        """Initialize SQLite database and open the tracker's shared connection"""
+        # One connection for the lifetime of the tracker; WAL avoids the
+        # rollback-journal fsync on every commit
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = self._conn
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')
         cursor = conn.cursor()
 
         # Create meetings table
@@ -103,6 +489,55 @@ class TrumpMeetingsTracker:
             # Columns already exist
             pass
 
+        # Indexes for the date_added filter and date ordering used by reports
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_meetings_date_added ON meetings (date_added)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_meetings_date_desc ON meetings (date DESC)
+        ''')
+
+        # Index for loading a meeting's attendees
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_attendees_meeting ON attendees (meeting_id)
+        ''')
+
+        # Migration: Add priority column (computed once at ingest time)
+        try:
+            cursor.execute('ALTER TABLE meetings ADD COLUMN priority TEXT')
+            print("✅ Added priority column to meetings table")
+        except sqlite3.OperationalError:
+            # Column already exists
+            pass
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_meeting_priority
+            ON meetings (priority, date_added DESC)
+        ''')
+
+        # Backfill priority for meetings saved before the column existed
+        # (same rule as classify_meeting_priority, evaluated by SQLite)
+        priority_industries_json = json.dumps(sorted(PRIORITY_INDUSTRIES))
+        cursor.execute('''
+            UPDATE meetings
+            SET priority = CASE
+                WHEN EXISTS (
+                    SELECT 1 FROM attendees a
+                    WHERE a.meeting_id = meetings.id
+                      AND a.confidence_level = 'high'
+                      AND a.primary_industry IN (SELECT value FROM json_each(?))
+                ) THEN 'high'
+                WHEN EXISTS (
+                    SELECT 1 FROM attendees a
+                    WHERE a.meeting_id = meetings.id
+                      AND a.confidence_level = 'medium'
+                      AND a.primary_industry IN (SELECT value FROM json_each(?))
+                ) THEN 'medium'
+                ELSE 'low'
+            END
+            WHERE priority IS NULL
+        ''', (priority_industries_json, priority_industries_json))
+
         # Initialize source_urls for existing records that don't have it
         cursor.execute('''
             UPDATE meetings
@@ -112,8 +547,55 @@ class TrumpMeetingsTracker:
         ''')
 
         conn.commit()
-        conn.close()
+
+    def close(self):
+        """Close the database connection (checkpoints the WAL into the .db file)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the enclosed writes as one transaction, committed on exit and rolled back on error
+        Nested use becomes a savepoint, so an inner failure only undoes the inner writes
+        """
+        conn = self._conn
+        if conn.in_transaction:
+            conn.execute('SAVEPOINT nested')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK TO nested')
+                conn.execute('RELEASE nested')
+                raise
+            conn.execute('RELEASE nested')
+        else:
+            conn.execute('BEGIN')
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
+    def get_search_sources(self) -> List[Tuple[str, Callable[..., List[Dict]]]]:
+        """
+        List the article sources to search
+        Returns list of (label, search function taking days_back and a fetch executor)
+        """
+        sources = []
+        if self.newsapi:
+            sources.append(('📰 NewsAPI', self.search_newsapi))
+        sources.append(('📡 RSS Feeds', self.search_rss_feeds))
+        return sources
+
     def search_all_sources(self, days_back=7) -> List[Dict]:
         """
         Search all sources for Trump meetings
@@ -124,17 +606,18 @@ class TrumpMeetingsTracker:
         print(f"🔍 Searching for meetings from last {days_back} days...")
         print()
         
-        # 1. Search NewsAPI
-        if self.newsapi:
-            newsapi_results = self.search_newsapi(days_back)
-            print(f"  📰 NewsAPI: Found {len(newsapi_results)} articles")
-            all_meetings.extend(newsapi_results)
-        
-        # 2. Search RSS Feeds
-        print(f"  📡 Searching RSS feeds...")
-        rss_results = self.search_rss_feeds(days_back)
-        print(f"  📡 RSS Feeds: Found {len(rss_results)} Trump-related articles")
-        all_meetings.extend(rss_results)
+        # Sources run side by side and queue their individual fetches on one
+        # shared pool, so every NewsAPI query and RSS feed is in flight together
+        sources = self.get_search_sources()
+        print(f"  Searching {', '.join(label for label, _ in sources)}...")
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as fetch_executor, \
+                ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [(label, executor.submit(search, days_back, fetch_executor))
+                       for label, search in sources]
+            for label, future in futures:
+                results = future.result()
+                print(f"  {label}: Found {len(results)} Trump-related articles")
+                all_meetings.extend(results)
         
         print()
         print(f"✅ Total articles found: {len(all_meetings)}")
@@ -143,39 +626,79 @@ class TrumpMeetingsTracker:
         meetings = []
         debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
 
-        for idx, article in enumerate(all_meetings):
-            if debug_mode and idx < 10:
-                print(f"\n  Article {idx+1}: {article['title'][:80]}...")
+        # Existing meeting keys, loaded once instead of queried per meeting
+        duplicate_index = self.load_duplicate_index()
 
-            parsed_meetings = self.parse_article_for_meetings(article)
+        # Filter (and optionally scrape) each article first, then run the
+        # attendee regexes over all surviving articles in one pass.
+        # Scraping is a network round-trip per article, so prepare concurrently;
+        # each worker collects its debug messages for printing in article order
+        def prepare(article):
+            log = []
+            return self.prepare_article_text(article, log=log), log
 
-            if debug_mode and idx < 10:
-                if parsed_meetings:
-                    print(f"    ✅ Extracted {len(parsed_meetings)} meeting(s)")
+        if all_meetings:
+            with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(all_meetings))) as executor:
+                prepared_results = list(executor.map(prepare, all_meetings))
+        else:
+            prepared_results = []
+
+        prepared_texts = [prepared_text for prepared_text, _ in prepared_results if prepared_text is not None]
+        attendees_per_article = iter(self.extract_attendees_batch(
+            [text for text, _ in prepared_texts],
+            [text_lower for _, text_lower in prepared_texts]
+        ))
+
+        # Source merges for duplicates commit together rather than one by one
+        with self.transaction():
+            for idx, (article, (prepared_text, log)) in enumerate(zip(all_meetings, prepared_results)):
+                if debug_mode and idx < 10:
+                    print(f"\n  Article {idx+1}: {article['title'][:80]}...")
+                for message in log:
+                    print(message)
+
+                if prepared_text is None:
+                    parsed_meetings = []
                 else:
-                    print(f"    ⚠️ No meetings extracted")
-
-            for meeting in parsed_meetings:
-                dup_check = self.is_duplicate_meeting(meeting)
-
-                if dup_check['should_merge']:
-                    # Same meeting from different source - merge the sources
-                    merged = self.merge_meeting_source(
-                        dup_check['meeting_id'],
-                        meeting.get('source_url'),
-                        meeting.get('source_publication')
+                    text, text_lower = prepared_text
+                    parsed_meetings = self.build_article_meetings(
+                        article, text, next(attendees_per_article), text_lower
                     )
-                    if merged and debug_mode:
-                        print(f"    🔗 Merged additional source for existing meeting")
-                elif not dup_check['is_duplicate']:
-                    # New meeting
-                    meetings.append(meeting)
+
+                if debug_mode and idx < 10:
+                    if parsed_meetings:
+                        print(f"    ✅ Extracted {len(parsed_meetings)} meeting(s)")
+                    else:
+                        print(f"    ⚠️ No meetings extracted")
+
+                for meeting in parsed_meetings:
+                    dup_check = self.is_duplicate_meeting(meeting, duplicate_index)
+
+                    if dup_check['should_merge']:
+                        # Same meeting from different source - merge the sources
+                        merged = self.merge_meeting_source(
+                            dup_check['meeting_id'],
+                            meeting.get('source_url'),
+                            meeting.get('source_publication')
+                        )
+                        if merged and debug_mode:
+                            print(f"    🔗 Merged additional source for existing meeting")
+                    elif not dup_check['is_duplicate']:
+                        # New meeting
+                        meetings.append(meeting)
         
         print(f"✅ Extracted {len(meetings)} unique meetings")
         
         return meetings
     
-    def search_newsapi(self, days_back=7) -> List[Dict]:
+    def _map_fetches(self, fetch: Callable, items: List, executor: Optional[ThreadPoolExecutor] = None):
+        """Run fetch over items concurrently, on executor if given, results in input order"""
+        if executor is not None:
+            return list(executor.map(fetch, items))
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(items))) as own_executor:
+            return list(own_executor.map(fetch, items))
+
+    def search_newsapi(self, days_back=7, executor: Optional[ThreadPoolExecutor] = None) -> List[Dict]:
         """Search NewsAPI for Trump meeting articles"""
         if not self.newsapi:
             return []
@@ -205,41 +728,50 @@ class TrumpMeetingsTracker:
             '"Trump hosted" business OR executives',
         ]
 
-        for query in queries:
-            try:
-                # Use relevancy sorting to get better matches
-                response = self.newsapi.get_everything(
-                    q=query,
-                    from_param=from_date,
-                    language='en',
-                    sort_by='relevancy',  # Changed from publishedAt
-                    page_size=15  # Reduced per query to stay within limits
-                )
-                
-                if response['status'] == 'ok':
-                    for article in response['articles']:
-                        articles.append({
-                            'title': article['title'],
-                            'description': article.get('description', ''),
-                            'url': article['url'],
-                            'source': article['source']['name'],
-                            'published_at': article['publishedAt'],
-                            'content': article.get('content', '')
-                        })
-            except Exception as e:
-                print(f"  ⚠️ Error searching NewsAPI for '{query}': {str(e)}")
-        
-        # Remove duplicates by URL
+        # Queries are independent network round-trips - run them concurrently,
+        # skipping articles already returned by an earlier query (by URL)
         seen_urls = set()
-        unique_articles = []
-        for article in articles:
-            if article['url'] not in seen_urls:
-                seen_urls.add(article['url'])
-                unique_articles.append(article)
-        
-        return unique_articles
+        for query_articles in self._map_fetches(
+            lambda query: self._run_newsapi_query(query, from_date),
+            queries,
+            executor
+        ):
+            for article in query_articles:
+                if article['url'] not in seen_urls:
+                    seen_urls.add(article['url'])
+                    articles.append(article)
+
+        return articles
     
-    def search_rss_feeds(self, days_back=7) -> List[Dict]:
+    def _run_newsapi_query(self, query: str, from_date: str) -> List[Dict]:
+        """Run one NewsAPI query and return its articles"""
+        articles = []
+        try:
+            # Use relevancy sorting to get better matches
+            response = self.newsapi.get_everything(
+                q=query,
+                from_param=from_date,
+                language='en',
+                sort_by='relevancy',  # Changed from publishedAt
+                page_size=15  # Reduced per query to stay within limits
+            )
+
+            if response['status'] == 'ok':
+                for article in response['articles']:
+                    articles.append({
+                        'title': article['title'],
+                        'description': article.get('description', ''),
+                        'url': article['url'],
+                        'source': article['source']['name'],
+                        'published_at': article['publishedAt'],
+                        'content': article.get('content', '')
+                    })
+        except Exception as e:
+            print(f"  ⚠️ Error searching NewsAPI for '{query}': {str(e)}")
+
+        return articles
+
+    def search_rss_feeds(self, days_back=7, executor: Optional[ThreadPoolExecutor] = None) -> List[Dict]:
         """Search RSS feeds for Trump meeting articles"""
         feeds = [
             # Google News - Trump business & CEO topics
@@ -280,77 +812,83 @@ class TrumpMeetingsTracker:
             'https://www.vox.com/rss/index.xml',  # Vox
         ]
         
-        articles = []
         cutoff_date = datetime.now() - timedelta(days=days_back)
 
         # Broader keywords to catch more articles
         keywords = ['trump']  # Just require 'trump', filter more specifically later
 
-        successful_feeds = 0
-        failed_feeds = 0
-
         debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
         if debug_mode:
             print(f"    Checking {len(feeds)} RSS feeds...")
 
-        for feed_url in feeds:
-            try:
-                feed = feedparser.parse(feed_url)
+        # Feed fetches are network-bound, so fetch them concurrently
+        articles = []
+        for feed_articles in self._map_fetches(
+            lambda feed_url: self._fetch_and_filter_feed(feed_url, cutoff_date, keywords),
+            feeds,
+            executor
+        ):
+            articles.extend(feed_articles)
+
+        return articles
+
+    def _fetch_and_filter_feed(self, feed_url: str, cutoff_date: datetime, keywords: List[str]) -> List[Dict]:
+        """Fetch one RSS feed and return its recent articles matching keywords"""
+        articles = []
+        debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
 
-                if not feed.entries:
-                    failed_feeds += 1
+        try:
+            # Download over the shared session (pooled, with a timeout),
+            # then parse the raw bytes (ElementTree, falling back to feedparser)
+            response = self.http.get(feed_url, timeout=10)
+            response.raise_for_status()
+            feed_title, entries = _parse_feed(response.content)
+
+            for entry in entries:
+                # Check if published recently (undated entries are included)
+                pub_date = entry['published_dt']
+                if pub_date is not None and pub_date < cutoff_date:
                     continue
 
-                successful_feeds += 1
-                feed_articles = 0
-
-                for entry in feed.entries:
-                    # Check if published recently
-                    if hasattr(entry, 'published_parsed'):
-                        try:
-                            pub_date = datetime(*entry.published_parsed[:6])
-                            if pub_date < cutoff_date:
-                                continue
-                        except:
-                            # If date parsing fails, include it anyway
-                            pass
-
-                    # Check if relevant keywords present
-                    text = f"{entry.title} {entry.get('summary', '')}".lower()
-                    if any(kw in text for kw in keywords):
-                        articles.append({
-                            'title': entry.title,
-                            'description': entry.get('summary', ''),
-                            'url': entry.link,
-                            'source': feed.feed.get('title', 'RSS Feed'),
-                            'published_at': entry.get('published', ''),
-                            'content': entry.get('summary', '')
-                        })
-                        feed_articles += 1
+                # Check if relevant keywords present - title first, and only
+                # lowercase the (often much longer) summary when the title misses
+                title_lower = entry['title'].lower()
+                matched = any(kw in title_lower for kw in keywords)
+                if not matched:
+                    summary_lower = entry['summary'].lower()
+                    matched = any(kw in summary_lower for kw in keywords)
+                if matched:
+                    articles.append({
+                        'title': entry['title'],
+                        'description': entry['summary'],
+                        'url': entry['link'],
+                        'source': feed_title or 'RSS Feed',
+                        'published_at': entry['published'],
+                        'content': entry['summary']
+                    })
 
-                # Debug: show which feeds are producing results
-                debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
-                if debug_mode and feed_articles > 0:
-                    print(f"    ✓ {feed.feed.get('title', feed_url)}: {feed_articles} articles")
+            # Debug: show which feeds are producing results
+            if debug_mode and articles:
+                print(f"    ✓ {feed_title or feed_url}: {len(articles)} articles")
+
+        except Exception as e:
+            # One bad feed shouldn't take down the others
+            if debug_mode:
+                print(f"    ✗ Error with {feed_url[:50]}: {str(e)[:50]}")
 
-            except Exception as e:
-                failed_feeds += 1
-                debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
-                if debug_mode:
-                    print(f"    ✗ Error with {feed_url[:50]}: {str(e)[:50]}")
-        
         return articles
     
-    def scrape_full_article(self, url: str) -> str:
+    def scrape_full_article(self, url: str, log: Optional[List[str]] = None) -> str:
         """
         Scrape full article text from URL
         Returns the article text or empty string if failed
+        Debug messages are appended to log if given, otherwise printed.
         """
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -390,7 +928,8 @@ class TrumpMeetingsTracker:
         except Exception as e:
             debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
             if debug_mode:
-                print(f"    ⚠️ Web scraping failed for {url[:50]}: {str(e)[:50]}")
+                say = print if log is None else log.append
+                say(f"    ⚠️ Web scraping failed for {url[:50]}: {str(e)[:50]}")
             return ""
 
     def parse_article_for_meetings(self, article: Dict) -> List[Dict]:
@@ -398,34 +937,69 @@ class TrumpMeetingsTracker:
         Parse article to extract meeting information
         Returns list of meeting dictionaries
         """
-        meetings = []
+        prepared = self.prepare_article_text(article)
+        if prepared is None:
+            return []
+        text, text_lower = prepared
+
+        # Extract attendees (name, title, company)
+        attendees = self.extract_attendees_batch([text], [text_lower])[0]
+
+        return self.build_article_meetings(article, text, attendees, text_lower)
+
+    def prepare_article_text(self, article: Dict, log: Optional[List[str]] = None) -> Optional[Tuple[str, str]]:
+        """
+        Filter an article and assemble its text for meeting extraction
+        Returns (text, text lowercased) with the scraped full article appended
+        if enabled, or None if filtered out. The lowercased copy is made once
+        here and shared by the extractors.
+        Debug messages are appended to log if given, otherwise printed.
+        """
+        debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
+        say = print if log is None else log.append
+
+        # Most articles never mention Trump - check each field (title first)
+        # before building and lowercasing the combined text
+        fields = (article['title'], article['description'], article.get('content', ''))
+        if not any('trump' in str(field).lower() for field in fields):
+            if debug_mode:
+                say(f"    ❌ Filtered: No 'trump' mention")
+            return None
 
         # Combine all text (summary first)
         text = f"{article['title']} {article['description']} {article.get('content', '')}"
+        text_lower = text.lower()
 
         # Check if it's actually about Trump meetings
         # Enable debug mode for first 5 articles to see filtering reasons
-        debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
-        if not self.is_trump_meeting_article(text, debug=debug_mode):
-            return []
+        if not self.is_trump_meeting_article(text, debug=debug_mode, text_lower=text_lower, log=log):
+            return None
 
         # If it passes initial filter, try to get full article text
         if os.environ.get('ENABLE_WEB_SCRAPING', 'true').lower() == 'true':
-            full_text = self.scrape_full_article(article['url'])
+            full_text = self.scrape_full_article(article['url'], log=log)
             if full_text:
                 # Prepend summary, then add full article
                 text = f"{text} {full_text}"
+                text_lower = f"{text_lower} {full_text.lower()}"
                 if debug_mode:
-                    print(f"    ✓ Scraped full article ({len(full_text)} chars)")
-        
+                    say(f"    ✓ Scraped full article ({len(full_text)} chars)")
+
+        return text, text_lower
+
+    def build_article_meetings(self, article: Dict, text: str, attendees: List[Dict],
+                               text_lower: Optional[str] = None) -> List[Dict]:
+        """
+        Build meeting dictionaries from an article's prepared text and extracted attendees
+        Returns list of meeting dictionaries
+        """
+        meetings = []
+
         # Extract date
         meeting_date = self.extract_meeting_date(text, article.get('published_at'))
         
         # Extract location
-        location = self.extract_location(text)
-        
-        # Extract attendees (name, title, company)
-        attendees = self.extract_attendees(text)
+        location = self.extract_location(text, text_lower)
 
         debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
         if not attendees:
@@ -487,69 +1061,56 @@ class TrumpMeetingsTracker:
         
         return meetings
     
-    def is_trump_meeting_article(self, text: str, debug: bool = False) -> bool:
-        """Check if article is about Trump meetings"""
-        text_lower = text.lower()
+    def is_trump_meeting_article(self, text: str, debug: bool = False, text_lower: Optional[str] = None,
+                                 log: Optional[List[str]] = None) -> bool:
+        """
+        Check if article is about Trump meetings (pass text_lower if already computed)
+        Debug messages are appended to log if given, otherwise printed.
+        """
+        say = print if log is None else log.append
+        if text_lower is None:
+            text_lower = text.lower()
 
         # Must mention Trump
         if 'trump' not in text_lower:
             if debug:
-                print(f"    ❌ Filtered: No 'trump' mention")
+                say(f"    ❌ Filtered: No 'trump' mention")
             return False
 
         # Must have meeting indicators WITH Trump
-        meeting_patterns = [
-            'trump meet', 'trump met', 'trump host', 'trump welcomed',
-            'meeting with trump', 'met with trump', 'hosted by trump'
-        ]
-        if not any(pattern in text_lower for pattern in meeting_patterns):
+        if not any(pattern in text_lower for pattern in _MEETING_PATTERNS):
             if debug:
-                print(f"    ❌ Filtered: No meeting pattern found")
+                say(f"    ❌ Filtered: No meeting pattern found")
             return False
 
         # Should mention business/executives (broader detection)
-        business_words = [
-            'ceo', 'chief executive', 'chairman', 'chief', 'business leader',
-            'executive', 'company', 'founder', 'entrepreneur', 'businessman',
-            'businesswoman', 'tech', 'corporation', 'industry', 'corporate',
-            'investor', 'billionaire', 'magnate'
-        ]
-        if not any(word in text_lower for word in business_words):
+        if not any(word in text_lower for word in _BUSINESS_WORDS):
             if debug:
-                print(f"    ❌ Filtered: No business words found")
-                print(f"       Text sample: {text_lower[:200]}")
+                say(f"    ❌ Filtered: No business words found")
+                say(f"       Text sample: {text_lower[:200]}")
             return False
 
         # Exclude articles primarily about foreign leaders or politics
         # But allow some political context (e.g., "CEO met Trump at White House to discuss tariffs")
-        political_keywords = [
-            'ukraine', 'russia', 'venezuela', 'maduro', 'macron', 'zelensky', 'iran',
-            'foreign leader', 'prime minister', 'nato', 'invasion', 'military',
-            'war', 'sanctions', 'diplomacy', 'treaty', 'ambassador'
-        ]
-        # Count political keywords
-        political_count = sum(1 for kw in political_keywords if kw in text_lower)
         # If more than 4 political keywords, likely not a business meeting (relaxed from 2)
-        if political_count > 4:
-            if debug:
-                print(f"    ❌ Filtered: Too many political keywords ({political_count})")
-            return False
+        political_count = 0
+        for kw in _POLITICAL_KEYWORDS:
+            if kw in text_lower:
+                political_count += 1
+                if political_count > 4:
+                    if debug:
+                        say(f"    ❌ Filtered: Too many political keywords ({political_count}+)")
+                    return False
 
         if debug:
-            print(f"    ✅ Passed Trump meeting article check")
+            say(f"    ✅ Passed Trump meeting article check")
         return True
     
     def extract_meeting_date(self, text: str, published_date: str = None) -> str:
         """Extract meeting date from text"""
         # Look for explicit dates
-        date_patterns = [
-            r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}',
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
         
@@ -564,17 +1125,11 @@ class TrumpMeetingsTracker:
         # Default to today
         return datetime.now().strftime('%B %d, %Y')
     
-    def extract_location(self, text: str) -> str:
-        """Extract meeting location from text"""
-        locations = {
-            'Mar-a-Lago': ['mar-a-lago', 'mar a lago'],
-            'White House, DC': ['white house'],
-            'Trump Tower, NY': ['trump tower'],
-            'Bedminster, NJ': ['bedminster']
-        }
-        
-        text_lower = text.lower()
-        for location, keywords in locations.items():
+    def extract_location(self, text: str, text_lower: Optional[str] = None) -> str:
+        """Extract meeting location from text (pass text_lower if already computed)"""
+        if text_lower is None:
+            text_lower = text.lower()
+        for location, keywords in _LOCATIONS:
             if any(kw in text_lower for kw in keywords):
                 return location
         
@@ -585,14 +1140,42 @@ class TrumpMeetingsTracker:
         Extract attendee names, titles, and companies from text
         Returns list of {name, title, company}
         """
-        attendees = []
-        
+        return self.extract_attendees_batch([text])[0]
+
+    def extract_attendees_batch(self, texts: List[str], texts_lower: Optional[List[str]] = None) -> List[List[Dict]]:
+        """
+        Extract attendees from many texts, running each attendee regex once over all of them
+        texts_lower optionally gives each text already lowercased
+        Returns one list of {name, title, company} per text
+        """
+        if texts_lower is None:
+            texts_lower = [text.lower() for text in texts]
+
         # Pattern 1: Name, Title of Company
         # Example: "Andy Jassy, CEO of Amazon"
         # Accept CEO/Chairman/Chief titles + President (but we'll filter out countries later)
-        pattern1 = r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s+(CEO|Chairman|Chief\s+Executive|Chief\s+Operating\s+Officer|CFO|COO|Chief\s+Financial\s+Officer|President|Founder|Co-Founder|Managing\s+Director|Executive\s+Chairman)\s+(?:of\s+|at\s+)([A-Z][A-Za-z0-9\s&\.]+?)(?:\.|,|\s+(?:said|told|announced|met|joined|attended))'
-        matches1 = re.findall(pattern1, text)
+        matches1 = _findall_batch(_ATTENDEE_PAT1, texts)
 
+        # Pattern 2: Company CEO Name
+        # Example: "Amazon CEO Andy Jassy", "Intel CEO Lip-Bu Tan"
+        # Accept CEO/Chairman/President/Founder (but we'll filter out countries later)
+        # More restrictive: company name should be 1-3 words max
+        # Support hyphenated names like Lip-Bu
+        matches2 = _findall_batch(_ATTENDEE_PAT2, texts)
+
+        return [
+            self._attendees_from_matches(text, text_lower, text_matches1, text_matches2)
+            for text, text_lower, text_matches1, text_matches2 in zip(texts, texts_lower, matches1, matches2)
+        ]
+
+    def _attendees_from_matches(self, text: str, text_lower: str,
+                                matches1: List[Tuple], matches2: List[Tuple]) -> List[Dict]:
+        """Turn one text's pattern 1/2 regex matches into attendees, then apply the fallback patterns"""
+        attendees = []
+        # Names in attendees, for constant-time duplicate checks
+        seen_names = set()
+
+        # Pattern 1: Name, Title of Company
         for match in matches1:
             name, title, company = match
             company = company.strip()
@@ -602,7 +1185,7 @@ class TrumpMeetingsTracker:
                 continue
 
             # Clean up company name
-            company = re.sub(r'\s+Inc\.?|\s+Corp\.?|\s+LLC|\s+Ltd\.?', '', company)
+            company = _COMPANY_SUFFIX_PAT.sub('', company)
 
             attendees.append({
                 'name': name.strip(),
@@ -610,15 +1193,9 @@ class TrumpMeetingsTracker:
                 'company': company.strip(),
                 'found_in_article': True
             })
+            seen_names.add(name.strip())
         
         # Pattern 2: Company CEO Name
-        # Example: "Amazon CEO Andy Jassy", "Intel CEO Lip-Bu Tan"
-        # Accept CEO/Chairman/President/Founder (but we'll filter out countries later)
-        # More restrictive: company name should be 1-3 words max
-        # Support hyphenated names like Lip-Bu
-        pattern2 = r'([A-Z][A-Za-z0-9]+(?:\s+[A-Z&][A-Za-z0-9]+){0,2})\s+(CEO|Chairman|Chief\s+Executive|President|Founder|Co-Founder|Managing\s+Director|Executive\s+Chairman)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+)'
-        matches2 = re.findall(pattern2, text)
-
         for match in matches2:
             company, title, name = match
             company = company.strip()
@@ -641,23 +1218,23 @@ class TrumpMeetingsTracker:
             if len(company.split()) > 4:
                 continue
 
-            company = re.sub(r'\s+Inc\.?|\s+Corp\.?|\s+LLC|\s+Ltd\.?', '', company)
+            company = _COMPANY_SUFFIX_PAT.sub('', company)
 
             # Avoid duplicates
-            if not any(a['name'] == name_str for a in attendees):
+            if name_str not in seen_names:
                 attendees.append({
                     'name': name_str,
                     'title': title.strip(),
                     'company': company.strip(),
                     'found_in_article': True
                 })
+                seen_names.add(name_str)
 
         # Pattern 2.5: Company CEO without name (e.g., "Trump meets Intel CEO")
         # Extract company and try to look up current CEO dynamically
         if len(attendees) == 0 and os.environ.get('ENABLE_DYNAMIC_CEO_LOOKUP', 'false').lower() == 'true':
             # Look for patterns: "Trump meets [Company] CEO" or "meeting with [Company] CEO"
-            company_ceo_pattern = r'(?:meets|met|hosted|host|meeting\s+with)\s+(?:with\s+)?([A-Z][A-Za-z0-9]+(?:\s+[A-Z&][A-Za-z0-9]+){0,2})\s+(CEO|Chairman|Chief\s+Executive|President)'
-            matches_company = re.findall(company_ceo_pattern, text)
+            matches_company = _COMPANY_CEO_PAT.findall(text)
 
             for match in matches_company[:1]:  # Only try first company mention
                 company, title = match
@@ -679,6 +1256,7 @@ class TrumpMeetingsTracker:
                         'company': company,
                         'found_in_article': False  # Name wasn't in article
                     })
+                    seen_names.add(ceo_info['name'])
                     break
 
         # Pattern 3: Just well-known names (Elon Musk, Tim Cook, etc.)
@@ -704,26 +1282,25 @@ class TrumpMeetingsTracker:
         }
 
         # Look for these names in the text
-        text_with_spaces = f" {text} "  # Add spaces for word boundary matching
         for name, info in prominent_ceos.items():
-            # Case-insensitive search with word boundaries
-            if name.lower() in text_with_spaces.lower():
+            # Case-insensitive search
+            if name.lower() in text_lower:
                 # Verify it's actually about this person (not just coincidence)
-                if not any(a['name'] == name for a in attendees):
+                if name not in seen_names:
                     attendees.append({
                         'name': name,
                         'title': info['title'],
                         'company': info['company'],
                         'found_in_article': True
                     })
+                    seen_names.add(name)
 
         # Pattern 4: Dynamic name extraction for unknown CEOs
         # Look for capitalized names that might be executives we don't know
         if len(attendees) == 0 and os.environ.get('ENABLE_DYNAMIC_CEO_LOOKUP', 'false').lower() == 'true':
             # Pattern: Two or three capitalized words (may include hyphens)
             # Examples: "John Smith", "Lip-Bu Tan", "Mary Jane Watson"
-            name_pattern = r'\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b'
-            potential_names = re.findall(name_pattern, text)
+            potential_names = _PERSON_NAME_PAT.findall(text)
 
             debug_mode = os.environ.get('DEBUG_FILTERING', 'false').lower() == 'true'
 
@@ -731,7 +1308,7 @@ class TrumpMeetingsTracker:
                 # Skip if it's Trump, Biden, or already found
                 if potential_name in ['Donald Trump', 'Joe Biden']:
                     continue
-                if any(a['name'] == potential_name for a in attendees):
+                if potential_name in seen_names:
                     continue
 
                 # IMPORTANT: Use looks_like_person_name() to filter out garbage
@@ -741,7 +1318,7 @@ class TrumpMeetingsTracker:
                     continue
 
                 # Check if this name appears near business/meeting context
-                name_pos = text.lower().find(potential_name.lower())
+                name_pos = text_lower.find(potential_name.lower())
                 if name_pos == -1:
                     continue
 
@@ -768,39 +1345,12 @@ class TrumpMeetingsTracker:
         """Check if the 'company' is actually a government entity or country"""
         company_lower = company_name.lower().strip()
 
-        # List of government/political keywords
-        government_keywords = [
-            'national assembly', 'government', 'ministry', 'parliament', 'congress',
-            'senate', 'administration', 'department of', 'agency', 'commission',
-            'federal', 'state department', 'white house', 'embassy', 'consulate',
-            'republic', 'kingdom', 'federation', 'union', 'nation', 'country',
-            'military', 'army', 'navy', 'defense', 'homeland security',
-            'foreign affairs', 'state', 'democratic', 'republic of',
-            'united states', 'european union', 'nato', 'un ', 'u.n.'
-        ]
-
-        # Countries and regions - expanded list
-        countries = [
-            'venezuela', 'france', 'ukraine', 'russia', 'iran', 'mexico', 'colombia',
-            'denmark', 'greenland', 'china', 'israel', 'syria', 'iraq', 'afghanistan',
-            'canada', 'britain', 'germany', 'italy', 'spain', 'poland', 'japan',
-            'korea', 'brazil', 'argentina', 'egypt', 'turkey', 'india', 'pakistan',
-            'saudi arabia', 'united arab emirates', 'qatar', 'taiwan', 'vietnam',
-            'thailand', 'indonesia', 'australia', 'new zealand', 'south africa'
-        ]
-
         # Check if it matches any government keywords or countries
-        for keyword in government_keywords + countries:
-            if keyword in company_lower:
-                return True
+        if _GOVERNMENT_OR_COUNTRY_PAT.search(company_lower):
+            return True
 
         # Check if it's too generic (single word entities that aren't companies)
-        nationality_adjectives = [
-            'danish', 'venezuelan', 'colombian', 'mexican', 'iranian', 'french',
-            'canadian', 'british', 'german', 'italian', 'spanish', 'japanese',
-            'korean', 'chinese', 'russian', 'ukrainian', 'israeli', 'egyptian'
-        ]
-        if len(company_lower.split()) == 1 and company_lower in nationality_adjectives:
+        if company_lower in _NATIONALITY_ADJECTIVES:
             return True
 
         return False
@@ -813,49 +1363,30 @@ class TrumpMeetingsTracker:
         if len(parts) < 2 or len(parts) > 3:
             return False
 
-        # Each part should be capitalized and reasonable length
-        # Handle hyphenated names like "Lip-Bu"
+        # Reject common non-name patterns (set lookups are cheaper than the
+        # per-character checks below, so do them first)
+        if any(part.lower() in _NON_NAME_WORDS for part in parts):
+            return False
+
         for part in parts:
-            # Split on hyphens to check each component
-            subparts = part.split('-')
-            for subpart in subparts:
-                if not subpart or not subpart[0].isupper():
+            # Each part should be capitalized and reasonable length
+            # Handle hyphenated names like "Lip-Bu"
+            for subpart in part.split('-'):
+                if not subpart or not ('A' <= subpart[0] <= 'Z'):
                     return False
                 if len(subpart) < 2:  # Each component should be at least 2 letters (allows "Li-" or "Bu")
                     return False
                 if len(subpart) > 15:  # Too long to be a name
                     return False
 
-        # Each part should be primarily lowercase letters after first char
-        # This filters out things like "Bu Tan" which might be fragments of words
-        for part in parts:
-            # For hyphenated parts, check the whole thing
+            # Each part should be primarily lowercase letters after first char
+            # This filters out things like "Bu Tan" which might be fragments of words
             lowercase_count = sum(1 for c in part[1:] if c.islower())
             alpha_count = sum(1 for c in part[1:] if c.isalpha())
             if alpha_count > 0 and lowercase_count < alpha_count * 0.4:
                 # Less than 40% lowercase letters (excluding hyphens) = probably not a name
                 return False
 
-        # Reject common non-name patterns
-        non_name_words = {
-            'president', 'ceo', 'chairman', 'chief', 'executive', 'officer',
-            'company', 'corporation', 'inc', 'llc', 'ltd', 'business',
-            'administration', 'department', 'agency', 'house', 'senate',
-            'heritage', 'foundation', 'project', 'act', 'services', 'education',
-            'disabilities', 'human', 'armed', 'vocational', 'aptitude', 'battery',
-            'head', 'start', 'reproductive', 'freedom', 'health', 'resources',
-            'secretary', 'robert', 'alive', 'abortion', 'survivors', 'medicaid',
-            'homeland', 'security', 'border', 'protection', 'customs', 'enforcement',
-            'national', 'weather', 'service', 'fair', 'labor', 'standards',
-            'supreme', 'court', 'civil', 'war', 'white', 'donald', 'trump',
-            # Technical/manufacturing terms
-            'made', 'sub', 'nanometer', 'chip', 'western', 'hemisphere', 'insanity',
-            'rules', 'united', 'states', 'north', 'south', 'east', 'west', 'new', 'york'
-        }
-
-        if any(part.lower() in non_name_words for part in parts):
-            return False
-
         return True
     
     def appears_near_meeting_context(self, name: str, text: str) -> bool:
@@ -898,17 +1429,14 @@ class TrumpMeetingsTracker:
         
         # First, check if we can infer from article context
         # Look for patterns like "person_name, who is/was CEO of Company"
-        patterns = [
-            f"{re.escape(person_name)}[^.]*?(?:CEO|President|Chairman|Chief Executive)[^.]*?(?:of|at)\\s+([A-Z][A-Za-z0-9]+(?:\\s+[A-Z][A-Za-z0-9]+)?)",
-            f"([A-Z][A-Za-z0-9]+(?:\\s+[A-Z][A-Za-z0-9]+)?)\\s+(?:CEO|President|Chairman)\\s+{re.escape(person_name)}"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, article_context, re.IGNORECASE)
+        context_patterns, search_patterns = _person_company_patterns(person_name)
+
+        for pattern in context_patterns:
+            match = pattern.search(article_context)
             if match:
                 company = match.group(1).strip()
                 # Clean up
-                company = re.sub(r'\s+Inc\.?|\s+Corp\.?|\s+LLC|\s+Ltd\.?', '', company)
+                company = _COMPANY_SUFFIX_PAT.sub('', company)
                 company = company.split(',')[0].split('.')[0].strip()
                 
                 # Validate it looks like a company name
@@ -937,17 +1465,12 @@ class TrumpMeetingsTracker:
                         article_text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}"
                         
                         # Look for clear company patterns
-                        patterns = [
-                            f"{re.escape(person_name)}[^.]*?(?:CEO|President|Chairman)[^.]*?(?:of|at)\\s+([A-Z][A-Za-z0-9]+(?:\\s+[A-Z][A-Za-z0-9]+)?)",
-                            f"([A-Z][A-Za-z0-9]+(?:\\s+[A-Z][A-Za-z0-9]+)?)\\s+(?:CEO|President|Chairman)\\s+{re.escape(person_name)}"
-                        ]
-                        
-                        for pattern in patterns:
-                            match = re.search(pattern, article_text, re.IGNORECASE)
+                        for pattern in search_patterns:
+                            match = pattern.search(article_text)
                             if match:
                                 company = match.group(1).strip()
                                 # Clean and validate
-                                company = re.sub(r'\s+Inc\.?|\s+Corp\.?|\s+LLC|\s+Ltd\.?', '', company)
+                                company = _COMPANY_SUFFIX_PAT.sub('', company)
                                 company = company.split(',')[0].split('.')[0].strip()
                                 
                                 # Check if it's a valid company name (not too long, not common words)
@@ -995,14 +1518,8 @@ class TrumpMeetingsTracker:
                     article_text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}"
 
                     # Look for patterns like "Company CEO Name" or "Name, CEO of Company"
-                    patterns = [
-                        f"{re.escape(company_name)}\\s+CEO\\s+([A-Z][a-z]+\\s+[A-Z][a-z]+)",
-                        f"([A-Z][a-z]+\\s+[A-Z][a-z]+),\\s+(?:CEO|Chief Executive|Chief Executive Officer)\\s+(?:of|at)\\s+{re.escape(company_name)}",
-                        f"([A-Z][a-z]+\\s+[A-Z][a-z]+)\\s+is\\s+(?:the\\s+)?CEO\\s+(?:of|at)\\s+{re.escape(company_name)}"
-                    ]
-
-                    for pattern in patterns:
-                        match = re.search(pattern, article_text, re.IGNORECASE)
+                    for pattern in _company_ceo_patterns(company_name):
+                        match = pattern.search(article_text)
                         if match:
                             ceo_name = match.group(1).strip()
 
@@ -1023,175 +1540,194 @@ class TrumpMeetingsTracker:
             print(f"    ✗ Could not find CEO for {company_name}")
         return None
 
+    def build_industry_index(self):
+        """Precompute lookup tables from the industry categories in config"""
+        # Known company (lowercased) -> industry; first category listing it wins
+        self._company_index = {}
+        # (known company lowercased, industry) in config order for partial matching
+        self._known_companies = []
+        # (known company 4-grams, industry) in config order for fuzzy matching
+        self._known_company_ngrams = []
+        # (keyword lowercased, industry), longest keyword first
+        self._industry_keywords = []
+
+        for industry_cat in self.config['industry_categories']:
+            for known_company in industry_cat.get('related_companies', []):
+                known_lower = known_company.lower()
+                self._company_index.setdefault(known_lower, industry_cat['name'])
+                self._known_companies.append((known_lower, industry_cat['name']))
+                self._known_company_ngrams.append((_char_ngrams(known_lower), industry_cat['name']))
+
+            for keyword in industry_cat.get('keywords', []):
+                keyword_lower = keyword.lower()
+                # Skip single-char or very short keywords
+                if len(keyword_lower) >= 4:
+                    self._industry_keywords.append((keyword_lower, industry_cat['name']))
+
+        # Stable sort keeps config order among keywords of equal length
+        self._industry_keywords.sort(key=lambda item: len(item[0]), reverse=True)
+
+        # Many attendees share companies, so memoize per normalized name
+        self._classify_cached = lru_cache(maxsize=4096)(self._classify_company)
+
     def classify_company_industry(self, company_name: str) -> Dict:
         """
         Classify company into industry categories using config
         Improved algorithm with better prioritization
         """
-        company_lower = company_name.lower().strip()
+        industry, confidence = self._classify_cached(company_name.lower().strip())
+        return {
+            'primary_industry': industry,
+            'secondary_industries': [],
+            'confidence': confidence
+        }
 
+    def _classify_company(self, company_lower: str) -> Tuple[str, str]:
+        """Classify a normalized company name, returns (industry, confidence)"""
         # Priority 1: Exact or near-exact match with known companies (HIGHEST CONFIDENCE)
-        for industry_cat in self.config['industry_categories']:
-            if 'related_companies' in industry_cat:
-                for known_company in industry_cat['related_companies']:
-                    known_lower = known_company.lower()
+        industry = self._company_index.get(company_lower)
+        if industry:
+            return industry, 'very high'
 
-                    # Exact match
-                    if company_lower == known_lower:
-                        return {
-                            'primary_industry': industry_cat['name'],
-                            'secondary_industries': [],
-                            'confidence': 'very high'
-                        }
-
-                    # Company name contains known company as whole word
-                    # e.g., "Intel Corporation" matches "Intel"
-                    if (f' {known_lower} ' in f' {company_lower} ' or
-                        company_lower.startswith(known_lower + ' ') or
-                        company_lower.endswith(' ' + known_lower) or
-                        company_lower == known_lower):
-                        return {
-                            'primary_industry': industry_cat['name'],
-                            'secondary_industries': [],
-                            'confidence': 'high'
-                        }
+        # Company name contains known company as whole word
+        # e.g., "Intel Corporation" matches "Intel"
+        padded_company = f' {company_lower} '
+        for known_lower, industry in self._known_companies:
+            if f' {known_lower} ' in padded_company:
+                return industry, 'high'
 
         # Priority 2: Known company partial match (MEDIUM-HIGH CONFIDENCE)
         # Only if company name is short enough to avoid false positives
         if len(company_lower) <= 20:
-            for industry_cat in self.config['industry_categories']:
-                if 'related_companies' in industry_cat:
-                    for known_company in industry_cat['related_companies']:
-                        known_lower = known_company.lower()
-
-                        # Fuzzy match for short names
-                        if self.fuzzy_match(known_lower, company_lower):
-                            return {
-                                'primary_industry': industry_cat['name'],
-                                'secondary_industries': [],
-                                'confidence': 'medium-high'
-                            }
+            # Fuzzy match for short names: any shared 4-char substring
+            company_ngrams = _char_ngrams(company_lower)
+            for known_ngrams, industry in self._known_company_ngrams:
+                if not company_ngrams.isdisjoint(known_ngrams):
+                    return industry, 'medium-high'
 
         # Priority 3: Industry-specific keywords (MEDIUM CONFIDENCE)
-        # Only match if keyword is significant portion of company name
-        keyword_matches = []
-        for industry_cat in self.config['industry_categories']:
-            if 'keywords' in industry_cat:
-                for keyword in industry_cat['keywords']:
-                    keyword_lower = keyword.lower()
-                    # Skip single-char or very short keywords
-                    if len(keyword_lower) < 4:
-                        continue
-                    # Check if keyword is in company name
-                    if keyword_lower in company_lower:
-                        # Calculate match quality based on keyword length vs company name
-                        match_score = len(keyword_lower) / len(company_lower)
-                        keyword_matches.append({
-                            'industry': industry_cat['name'],
-                            'score': match_score,
-                            'keyword': keyword_lower
-                        })
-
-        # Return best keyword match if any found
-        if keyword_matches:
-            best_match = max(keyword_matches, key=lambda x: x['score'])
-            # Only accept if keyword is at least 30% of company name
-            if best_match['score'] >= 0.3:
-                return {
-                    'primary_industry': best_match['industry'],
-                    'secondary_industries': [],
-                    'confidence': 'medium'
-                }
+        # Keywords are sorted longest first, so the first hit has the best
+        # match quality (keyword length vs company name length)
+        for keyword_lower, industry in self._industry_keywords:
+            if keyword_lower in company_lower:
+                # Only accept if keyword is at least 30% of company name
+                if len(keyword_lower) / len(company_lower) >= 0.3:
+                    return industry, 'medium'
+                break
 
         # No good match found
-        return {
-            'primary_industry': 'Other',
-            'secondary_industries': [],
-            'confidence': 'low'
-        }
+        return 'Other', 'low'
     
     def fuzzy_match(self, str1: str, str2: str) -> bool:
         """Simple fuzzy string matching"""
-        # Check if significant portion of one string is in the other
-        if len(str1) < 4 or len(str2) < 4:
-            return False
-        
-        # Check for common core (at least 4 chars)
-        for i in range(len(str1) - 3):
-            substr = str1[i:i+4]
-            if substr in str2:
-                return True
-        
-        return False
+        # Check for common core (at least 4 chars) - strings shorter than
+        # that have no 4-grams and never match
+        return not _char_ngrams(str1).isdisjoint(_char_ngrams(str2))
     
-    def is_duplicate_meeting(self, meeting_data: Dict) -> Dict:
+    def load_duplicate_index(self) -> Dict:
+        """
+        Load the keys is_duplicate_meeting checks against in a single query
+        Returns: {
+            'source_urls': {source_url: meeting_id},
+            'by_date': {date: [(meeting_id, [lowercased attendee names])]}
+        }
+        """
+        source_urls = {}
+        by_date = {}
+        last_id = None
+
+        rows = self._conn.execute('''
+            SELECT m.id, m.date, m.source_url, a.name
+            FROM meetings m
+            LEFT JOIN attendees a ON a.meeting_id = m.id
+            ORDER BY m.id, a.id
+        ''')
+        for meeting_id, meeting_date, source_url, name in rows:
+            if meeting_id != last_id:
+                last_id = meeting_id
+                if source_url is not None:
+                    source_urls.setdefault(source_url, meeting_id)
+                names = []
+                by_date.setdefault(meeting_date, []).append((meeting_id, names))
+            if name is not None:
+                names.append(name.strip().lower())
+
+        return {'source_urls': source_urls, 'by_date': by_date}
+
+    def _load_duplicate_keys(self, meeting_date: str, source_url: Optional[str]) -> Dict:
+        """
+        Load only the keys one meeting is checked against, in the
+        load_duplicate_index() layout: its source URL and its date's meetings
+        """
+        source_urls = {}
+        exact_match = self._conn.execute('''
+            SELECT id FROM meetings WHERE source_url = ? ORDER BY id LIMIT 1
+        ''', (source_url,)).fetchone()
+        if exact_match:
+            source_urls[source_url] = exact_match[0]
+
+        same_date = []
+        last_id = None
+        rows = self._conn.execute('''
+            SELECT m.id, a.name
+            FROM meetings m
+            LEFT JOIN attendees a ON a.meeting_id = m.id
+            WHERE m.date = ?
+            ORDER BY m.id, a.id
+        ''', (meeting_date,))
+        for meeting_id, name in rows:
+            if meeting_id != last_id:
+                last_id = meeting_id
+                names = []
+                same_date.append((meeting_id, names))
+            if name is not None:
+                names.append(name.strip().lower())
+
+        return {'source_urls': source_urls, 'by_date': {meeting_date: same_date}}
+
+    def is_duplicate_meeting(self, meeting_data: Dict, index: Optional[Dict] = None) -> Dict:
         """
         Check if meeting already exists in database by date + attendee name
+        Pass an index from load_duplicate_index() when checking many meetings;
+        without one, only this meeting's source URL and date are queried
         Returns: {
             'is_duplicate': bool,
             'meeting_id': int or None,
             'should_merge': bool  # True if same meeting from different source
         }
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         meeting_date = meeting_data.get('date')
         attendees = meeting_data.get('attendees', [])
 
         # If no date or no attendees, can't deduplicate intelligently
         if not meeting_date or not attendees:
-            conn.close()
             return {'is_duplicate': False, 'meeting_id': None, 'should_merge': False}
 
-        # Check if this exact source URL already exists
-        cursor.execute('''
-            SELECT id FROM meetings
-            WHERE source_url = ?
-        ''', (meeting_data.get('source_url'),))
+        if index is None:
+            index = self._load_duplicate_keys(meeting_date, meeting_data.get('source_url'))
 
-        exact_match = cursor.fetchone()
-        if exact_match:
-            conn.close()
-            return {'is_duplicate': True, 'meeting_id': exact_match[0], 'should_merge': False}
+        # Check if this exact source URL already exists
+        exact_match = index['source_urls'].get(meeting_data.get('source_url'))
+        if exact_match is not None:
+            return {'is_duplicate': True, 'meeting_id': exact_match, 'should_merge': False}
 
         # Check for same meeting from different source (by date + attendee name)
-        # Get all meetings on the same date
-        cursor.execute('''
-            SELECT m.id
-            FROM meetings m
-            WHERE m.date = ?
-        ''', (meeting_date,))
-
-        potential_duplicates = cursor.fetchall()
-
-        for (meeting_id,) in potential_duplicates:
-            # Get attendees for this meeting
-            cursor.execute('''
-                SELECT name FROM attendees WHERE meeting_id = ?
-            ''', (meeting_id,))
-
-            existing_attendees = [row[0] for row in cursor.fetchall()]
-
+        for meeting_id, existing_attendees in index['by_date'].get(meeting_date, []):
             # Check if any attendee name matches
             for new_attendee in attendees:
                 new_name = new_attendee.get('name', '').strip().lower()
-                for existing_name in existing_attendees:
-                    existing_name_lower = existing_name.strip().lower()
-
+                for existing_name_lower in existing_attendees:
                     # Exact match or one name contains the other
                     if (new_name == existing_name_lower or
                         (len(new_name) > 5 and new_name in existing_name_lower) or
                         (len(existing_name_lower) > 5 and existing_name_lower in new_name)):
 
-                        conn.close()
                         return {
                             'is_duplicate': True,
                             'meeting_id': meeting_id,
                             'should_merge': True  # Same meeting, different source
                         }
 
-        conn.close()
         return {'is_duplicate': False, 'meeting_id': None, 'should_merge': False}
 
     def merge_meeting_source(self, meeting_id: int, new_source_url: str, new_source_publication: str) -> bool:
@@ -1199,200 +1735,285 @@ class TrumpMeetingsTracker:
         Merge a new source into an existing meeting
         Updates source_urls array and source_count
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         try:
-            # Get current source_urls
-            cursor.execute('''
-                SELECT source_urls, source_url, source_publication
-                FROM meetings
-                WHERE id = ?
-            ''', (meeting_id,))
-
-            row = cursor.fetchone()
-            if not row:
-                conn.close()
-                return False
+            with self.transaction():
+                # Get current source_urls
+                cursor.execute('''
+                    SELECT source_urls, source_url, source_publication
+                    FROM meetings
+                    WHERE id = ?
+                ''', (meeting_id,))
 
-            source_urls_json, original_url, original_pub = row
+                row = cursor.fetchone()
+                if not row:
+                    return False
 
-            # Parse existing sources
-            if source_urls_json:
-                try:
-                    source_urls = json.loads(source_urls_json)
-                except (json.JSONDecodeError, TypeError):
-                    source_urls = [original_url] if original_url else []
-            else:
-                source_urls = [original_url] if original_url else []
+                source_urls_json, original_url, original_pub = row
 
-            # Add new source if not already present
-            if new_source_url not in source_urls:
-                source_urls.append(new_source_url)
+                # Parse existing sources
+                if source_urls_json:
+                    try:
+                        source_urls = json.loads(source_urls_json)
+                    except (json.JSONDecodeError, TypeError):
+                        source_urls = [original_url] if original_url else []
+                else:
+                    source_urls = [original_url] if original_url else []
 
-                # Update the meeting record
-                cursor.execute('''
-                    UPDATE meetings
-                    SET source_urls = ?,
-                        source_count = ?,
-                        source_publication = ?
-                    WHERE id = ?
-                ''', (
-                    json.dumps(source_urls),
-                    len(source_urls),
-                    f"{original_pub}, {new_source_publication}" if original_pub else new_source_publication,
-                    meeting_id
-                ))
-
-                conn.commit()
-                conn.close()
-                return True
-            else:
-                conn.close()
-                return False
+                # Add new source if not already present
+                if new_source_url not in source_urls:
+                    source_urls.append(new_source_url)
+
+                    # Update the meeting record
+                    cursor.execute('''
+                        UPDATE meetings
+                        SET source_urls = ?,
+                            source_count = ?,
+                            source_publication = ?
+                        WHERE id = ?
+                    ''', (
+                        json.dumps(source_urls),
+                        len(source_urls),
+                        f"{original_pub}, {new_source_publication}" if original_pub else new_source_publication,
+                        meeting_id
+                    ))
+
+                    return True
+                else:
+                    return False
 
         except Exception as e:
             print(f"  ⚠️ Error merging source: {str(e)}")
-            conn.close()
             return False
 
+    def classify_meeting_priority(self, attendees: List[Dict]) -> str:
+        """
+        Determine email priority for a meeting from its attendees
+        Returns 'high', 'medium' or 'low'
+        """
+        seen_medium = False
+        for attendee in attendees:
+            if attendee.get('primary_industry', 'Other') not in PRIORITY_INDUSTRIES:
+                continue
+
+            confidence = attendee.get('confidence_level', 'low')
+            if confidence == 'high':
+                # Nothing outranks high - stop scanning
+                return 'high'
+            if confidence == 'medium':
+                seen_medium = True
+
+        return 'medium' if seen_medium else 'low'
+
+    def _attendee_row(self, meeting_id: int, attendee: Dict) -> Tuple:
+        """Attendee as a parameter tuple for the attendees INSERT"""
+        return (
+            meeting_id,
+            attendee['name'],
+            attendee.get('title'),
+            attendee.get('company'),
+            attendee.get('primary_industry'),
+            json.dumps(attendee.get('secondary_industries', [])),
+            attendee.get('confidence_level'),
+            json.dumps(attendee.get('confidence_reasons', [])),
+            attendee.get('requires_review', False)
+        )
+
     def save_meeting(self, meeting_data: Dict) -> int:
         """Save meeting to database, return meeting_id"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.save_meetings_batch([meeting_data])[0]
 
-        source_url = meeting_data.get('source_url')
-        source_urls_json = json.dumps([source_url]) if source_url else json.dumps([])
+    def save_meetings_batch(self, meetings: List[Dict]) -> List[int]:
+        """Save meetings in a single transaction, return meeting_id per meeting (-1 if skipped)"""
+        cursor = self._conn.cursor()
+        date_added = datetime.now().isoformat()
 
+        meeting_ids = []
+        saved_meetings = []
         try:
-            cursor.execute('''
-                INSERT INTO meetings (date, location, meeting_type, source_url,
-                                    source_publication, date_added, notes,
-                                    source_urls, source_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                meeting_data.get('date'),
-                meeting_data.get('location'),
-                meeting_data.get('type'),
-                source_url,
-                meeting_data.get('source_publication'),
-                datetime.now().isoformat(),
-                meeting_data.get('notes'),
-                source_urls_json,
-                1
-            ))
-            
-            meeting_id = cursor.lastrowid
-            
-            # Save attendees
-            for attendee in meeting_data.get('attendees', []):
-                cursor.execute('''
+            with self.transaction():
+                for meeting_data in meetings:
+                    source_url = meeting_data.get('source_url')
+                    source_urls_json = json.dumps([source_url]) if source_url else json.dumps([])
+                    priority = self.classify_meeting_priority(meeting_data.get('attendees', []))
+
+                    # Insert meetings one at a time inside the open transaction so
+                    # each lastrowid is available for its attendees. OR IGNORE
+                    # skips rows that hit the UNIQUE(date, location, source_url)
+                    # constraint (or lack a date) without a separate lookup
+                    cursor.execute('''
+                        INSERT OR IGNORE INTO meetings (date, location, meeting_type, source_url,
+                                                        source_publication, date_added, notes,
+                                                        source_urls, source_count, priority)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (
+                        meeting_data.get('date'),
+                        meeting_data.get('location'),
+                        meeting_data.get('type'),
+                        source_url,
+                        meeting_data.get('source_publication'),
+                        date_added,
+                        meeting_data.get('notes'),
+                        source_urls_json,
+                        1,
+                        priority
+                    ))
+                    if cursor.rowcount == 0:
+                        # Duplicate - skip
+                        meeting_ids.append(-1)
+                        continue
+
+                    meeting_ids.append(cursor.lastrowid)
+                    saved_meetings.append((cursor.lastrowid, meeting_data))
+
+                # Save attendees for every inserted meeting in one executemany
+                attendee_rows = [
+                    self._attendee_row(meeting_id, attendee)
+                    for meeting_id, meeting_data in saved_meetings
+                    for attendee in meeting_data.get('attendees', [])
+                ]
+                cursor.executemany('''
                     INSERT INTO attendees (meeting_id, name, title, company, 
                                          primary_industry, secondary_industries,
                                          confidence_level, confidence_reasons, requires_review)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    meeting_id,
-                    attendee['name'],
-                    attendee.get('title'),
-                    attendee.get('company'),
-                    attendee.get('primary_industry'),
-                    json.dumps(attendee.get('secondary_industries', [])),
-                    attendee.get('confidence_level'),
-                    json.dumps(attendee.get('confidence_reasons', [])),
-                    attendee.get('requires_review', False)
-                ))
-            
-            conn.commit()
-        except sqlite3.IntegrityError:
-            # Duplicate - skip
-            conn.close()
-            return -1
+                ''', attendee_rows)
+
         except Exception as e:
-            print(f"  ⚠️ Error saving meeting: {str(e)}")
-            conn.close()
-            return -1
-        
-        conn.close()
-        return meeting_id
+            print(f"  ⚠️ Error saving meetings: {str(e)}")
+            return [-1] * len(meetings)
+
+        return meeting_ids
     
-    def get_new_meetings(self, since_date: str) -> List[Dict]:
-        """Get meetings added since a specific date"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def get_new_meetings(self, since_date: str, priority: str = None) -> List[Dict]:
+        """Get meetings added since a specific date, optionally only one priority level"""
+        # Attendees carry only the columns the email uses;
+        # see get_attendee_details for the JSON list fields
+        if priority:
+            return self._load_meetings('WHERE m.priority = ? AND m.date_added >= ?', (priority, since_date),
+                                       ATTENDEE_SUMMARY_COLUMNS)
+        return self._load_meetings('WHERE m.date_added >= ?', (since_date,), ATTENDEE_SUMMARY_COLUMNS)
+
+    def get_attendee_details(self, attendee_id: int) -> Optional[Dict]:
+        """Get a single attendee with its JSON list fields decoded"""
+        conn = self._conn
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         cursor.execute('''
-            SELECT * FROM meetings
-            WHERE date_added >= ?
-            ORDER BY date DESC
-        ''', (since_date,))
+            SELECT * FROM attendees WHERE id = ?
+        ''', (attendee_id,))
+        row = cursor.fetchone()
 
-        meetings = []
-        for meeting_row in cursor.fetchall():
-            meeting = dict(meeting_row)
-
-            # Get attendees for this meeting
-            cursor.execute('''
-                SELECT * FROM attendees WHERE meeting_id = ?
-            ''', (meeting['id'],))
-
-            attendees = []
-            for att_row in cursor.fetchall():
-                attendee = dict(att_row)
-                try:
-                    attendee['secondary_industries'] = json.loads(attendee['secondary_industries'])
-                    attendee['confidence_reasons'] = json.loads(attendee['confidence_reasons'])
-                except:
-                    attendee['secondary_industries'] = []
-                    attendee['confidence_reasons'] = []
-                attendees.append(attendee)
-
-            meeting['attendees'] = attendees
-            meetings.append(meeting)
-
-        conn.close()
-        return meetings
+        if not row:
+            return None
+
+        return self._decode_attendee_json(dict(row))
 
     def get_all_meetings(self) -> List[Dict]:
         """Get all meetings from the database (for Excel report)"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        return self._load_meetings('', (), ATTENDEE_COLUMNS)
 
-        cursor.execute('''
-            SELECT * FROM meetings
-            ORDER BY date DESC
-        ''')
+    def _decode_attendee_json(self, attendee: Dict) -> Dict:
+        """Decode an attendee's JSON list fields in place"""
+        try:
+            for key in ('secondary_industries', 'confidence_reasons'):
+                raw = attendee.get(key)
+                # NULL, '' and the '[]' written for empty lists skip the decoder
+                attendee[key] = _json_loads(raw) if raw and raw != '[]' else []
+        except:
+            attendee['secondary_industries'] = []
+            attendee['confidence_reasons'] = []
+        return attendee
+
+    def _load_meetings(self, where_sql: str, params: Tuple, attendee_columns: Tuple[str, ...]) -> List[Dict]:
+        """
+        Load meetings (newest first) with their attendees in a single JOIN query
+        where_sql filters meetings (alias m); attendee_columns picks the attendee
+        fields, with the JSON list fields decoded when included
+        """
+        cursor = self._conn.execute(f'''
+            SELECT m.*, {', '.join('a.' + column for column in attendee_columns)}
+            FROM meetings m
+            LEFT JOIN attendees a ON a.meeting_id = m.id
+            {where_sql}
+            ORDER BY m.date DESC, m.id, a.id
+        ''', params)
+
+        # Row layout: all meeting columns, then the requested attendee columns
+        meeting_column_count = len(cursor.description) - len(attendee_columns)
+        meeting_columns = [column[0] for column in cursor.description[:meeting_column_count]]
+        decode_json = 'confidence_reasons' in attendee_columns
+
+        meetings_by_id = {}
+        for row in cursor:
+            meeting_values = row[:meeting_column_count]
+            meeting = meetings_by_id.get(meeting_values[0])
+            if meeting is None:
+                meeting = dict(zip(meeting_columns, meeting_values))
+                meeting['attendees'] = []
+                meetings_by_id[meeting['id']] = meeting
+
+            attendee_values = row[meeting_column_count:]
+            if attendee_values[0] is None:
+                # Meeting without attendees (LEFT JOIN filler row)
+                continue
+            attendee = dict(zip(attendee_columns, attendee_values))
+            if decode_json:
+                self._decode_attendee_json(attendee)
+            meeting['attendees'].append(attendee)
 
-        meetings = []
-        for meeting_row in cursor.fetchall():
-            meeting = dict(meeting_row)
-
-            # Get attendees for this meeting
-            cursor.execute('''
-                SELECT * FROM attendees WHERE meeting_id = ?
-            ''', (meeting['id'],))
-
-            attendees = []
-            for att_row in cursor.fetchall():
-                attendee = dict(att_row)
-                try:
-                    attendee['secondary_industries'] = json.loads(attendee['secondary_industries'])
-                    attendee['confidence_reasons'] = json.loads(attendee['confidence_reasons'])
-                except:
-                    attendee['secondary_industries'] = []
-                    attendee['confidence_reasons'] = []
-                attendees.append(attendee)
-
-            meeting['attendees'] = attendees
-            meetings.append(meeting)
-
-        conn.close()
-        return meetings
+        return list(meetings_by_id.values())
+
+    def get_stats(self, meeting_ids: Optional[List[int]] = None) -> Dict[str, Counter]:
+        """
+        Count attendees by industry, confidence level, company and meeting location
+        Counts cover only meeting_ids when given, otherwise the whole database.
+        The four GROUP BY aggregates run as one UNION ALL query, tagged by stat name;
+        values are inserted in order of first appearance (meetings newest first),
+        so most_common() breaks ties the same way as counting the loaded meetings
+        """
+        where_sql = ''
+        params = ()
+        if meeting_ids is not None:
+            where_sql = 'WHERE m.id IN (SELECT value FROM json_each(?))'
+            params = (json.dumps(list(meeting_ids)),)
+
+        cursor = self._conn.execute(f'''
+            WITH attendee_rows AS (
+                SELECT a.primary_industry,
+                       COALESCE(NULLIF(UPPER(a.confidence_level), ''), 'UNKNOWN') AS confidence,
+                       a.company,
+                       m.location,
+                       ROW_NUMBER() OVER (ORDER BY m.date DESC, m.id, a.id) AS position
+                FROM attendees a JOIN meetings m ON m.id = a.meeting_id
+                {where_sql}
+            )
+            SELECT 'industries', primary_industry, COUNT(*), MIN(position)
+            FROM attendee_rows GROUP BY primary_industry
+            UNION ALL
+            SELECT 'confidence_levels', confidence, COUNT(*), MIN(position)
+            FROM attendee_rows GROUP BY confidence
+            UNION ALL
+            SELECT 'companies', company, COUNT(*), MIN(position)
+            FROM attendee_rows GROUP BY company
+            UNION ALL
+            SELECT 'locations', location, COUNT(*), MIN(position)
+            FROM attendee_rows GROUP BY location
+            ORDER BY 4
+        ''', params)
+
+        stats = {name: Counter() for name in ('industries', 'confidence_levels', 'companies', 'locations')}
+        for name, value, count, _ in cursor:
+            stats[name][value] = count
+        return stats
     
-    def generate_email_html(self, meetings: List[Dict]) -> str:
-        """Generate HTML email from meetings data"""
+    def generate_email_html(self, meetings: List[Dict], report_ts: str = None) -> str:
+        """
+        Generate HTML email from meetings data
+        report_ts is the formatted report time shown in the summary (now if not given)
+        """
         if not meetings:
             return """
             <html>
@@ -1403,40 +2024,21 @@ class TrumpMeetingsTracker:
             </html>
             """
         
-        # Categorize by priority
-        high_priority = []
-        medium_priority = []
-        low_priority = []
-        
-        priority_industries = [
-            '3PL', 'Asian 3PL', 'Agriculture', 'Automotive', 'Building Materials',
-            'Data Center', 'E-Commerce', 'Asian E-Commerce', 'Food & Beverage',
-            'Fulfillment & Packaging', 'Life Sciences', 'Manufacturing',
-            'Powered Land', 'Retail', 'Wholesaler', 'Cold Storage'
-        ]
-        
+        # Categorize by priority (precomputed at save time, see save_meeting)
+        buckets = {'high': [], 'medium': [], 'low': []}
         for meeting in meetings:
-            meeting_priority = 'low'
-            for attendee in meeting['attendees']:
-                industry = attendee.get('primary_industry', 'Other')
-                confidence = attendee.get('confidence_level', 'low')
-                
-                if industry in priority_industries:
-                    if confidence == 'high':
-                        meeting_priority = 'high'
-                        break
-                    elif confidence == 'medium' and meeting_priority != 'high':
-                        meeting_priority = 'medium'
-            
-            if meeting_priority == 'high':
-                high_priority.append(meeting)
-            elif meeting_priority == 'medium':
-                medium_priority.append(meeting)
-            else:
-                low_priority.append(meeting)
-        
-        # Build HTML
-        html = f"""
+            buckets[meeting.get('priority') or self.classify_meeting_priority(meeting['attendees'])].append(meeting)
+
+        high_priority = buckets['high']
+        medium_priority = buckets['medium']
+        low_priority = buckets['low']
+
+        # Format the report timestamp once for the whole email
+        if report_ts is None:
+            report_ts = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+
+        # Build HTML from parts joined once at the end
+        parts = [f"""
         <html>
         <head>
             <style>
@@ -1464,31 +2066,28 @@ class TrumpMeetingsTracker:
         <body>
             <h1>Trump Meetings Report</h1>
             <div class="summary">
-                <strong>Report Generated:</strong> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}<br>
+                <strong>Report Generated:</strong> {report_ts}<br>
                 <strong>Period:</strong> Last 7 days<br>
                 <strong>New Meetings:</strong> {len(meetings)}<br>
                 <strong>High Priority:</strong> {len(high_priority)} | 
                 <strong>Medium Priority:</strong> {len(medium_priority)} | 
                 <strong>Other:</strong> {len(low_priority)}
             </div>
-        """
+        """]
         
         if high_priority:
-            html += "<h2>High Priority - Your Industries</h2>"
-            for meeting in high_priority:
-                html += self.format_meeting_html(meeting, 'high-priority')
+            parts.append("<h2>High Priority - Your Industries</h2>")
+            parts.extend(self.format_meeting_html(meeting, 'high-priority') for meeting in high_priority)
         
         if medium_priority:
-            html += "<h2>Medium Priority</h2>"
-            for meeting in medium_priority:
-                html += self.format_meeting_html(meeting, 'medium-priority')
+            parts.append("<h2>Medium Priority</h2>")
+            parts.extend(self.format_meeting_html(meeting, 'medium-priority') for meeting in medium_priority)
         
         if low_priority:
-            html += "<h2>Other Meetings</h2>"
-            for meeting in low_priority:
-                html += self.format_meeting_html(meeting, 'low-priority')
+            parts.append("<h2>Other Meetings</h2>")
+            parts.extend(self.format_meeting_html(meeting, 'low-priority') for meeting in low_priority)
         
-        html += """
+        parts.append("""
             <div style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #e5e7eb; font-size: 0.9em; color: #4b5563;">
                 <p><strong>About This Report</strong></p>
                 <ul>
@@ -1501,28 +2100,28 @@ class TrumpMeetingsTracker:
             </div>
         </body>
         </html>
-        """
+        """)
         
-        return html
+        return ''.join(parts)
     
     def format_meeting_html(self, meeting: Dict, css_class: str) -> str:
         """Format a single meeting as HTML"""
-        html = f'<div class="{css_class}">'
-        html += f'<div class="meeting-date">{meeting["date"]} - {meeting.get("location", "Location TBD")}</div>'
+        parts = [
+            f'<div class="{css_class}">',
+            f'<div class="meeting-date">{_e(meeting["date"])} - {_e(meeting.get("location", "Location TBD"))}</div>'
+        ]
         
-        for attendee in meeting['attendees']:
-            confidence_class = attendee.get('confidence_level', 'low')
-            html += f'''
+        parts.extend(f'''
             <div class="attendee">
-                <strong>{attendee["name"]}</strong> - {attendee.get("title", "Executive")}<br>
-                <span class="company">{attendee.get("company", "Unknown Company")}</span><br>
-                <span class="industry">Industry: {attendee.get("primary_industry", "Unknown")}</span><br>
-                <span class="confidence {confidence_class}">Confidence: {attendee.get("confidence_level", "unknown").upper()}</span>
+                <strong>{_e(attendee["name"])}</strong> - {_e(attendee.get("title", "Executive"))}<br>
+                <span class="company">{_e(attendee.get("company", "Unknown Company"))}</span><br>
+                <span class="industry">Industry: {_e(attendee.get("primary_industry", "Unknown"))}</span><br>
+                <span class="confidence {_e(attendee.get("confidence_level", "low"))}">Confidence: {_e(attendee.get("confidence_level", "unknown").upper())}</span>
             </div>
-            '''
+            ''' for attendee in meeting['attendees'])
         
         if meeting.get('notes'):
-            html += f'<div style="margin-top:10px; font-size:0.9em; color:#666;"><strong>Context:</strong> {meeting["notes"]}</div>'
+            parts.append(f'<div style="margin-top:10px; font-size:0.9em; color:#666;"><strong>Context:</strong> {_e(meeting["notes"])}</div>')
 
         # Show multiple sources if available
         source_urls_json = meeting.get('source_urls', '[]')
@@ -1534,21 +2133,26 @@ class TrumpMeetingsTracker:
         if source_urls:
             source_count = len(source_urls)
             if source_count > 1:
-                html += f'<div class="source"><strong>Reported by {source_count} sources:</strong><br>'
-                for i, url in enumerate(source_urls, 1):
-                    html += f'{i}. <a href="{url}">Source {i}</a><br>'
-                html += '</div>'
+                parts.append(f'<div class="source"><strong>Reported by {source_count} sources:</strong><br>')
+                parts.extend(f'{i}. <a href="{_e(url)}">Source {i}</a><br>' for i, url in enumerate(source_urls, 1))
+                parts.append('</div>')
             elif source_urls[0]:
-                html += f'<div class="source">Source: <a href="{source_urls[0]}">{meeting.get("source_publication", "View Article")}</a></div>'
+                parts.append(f'<div class="source">Source: <a href="{_e(source_urls[0])}">{_e(meeting.get("source_publication", "View Article"))}</a></div>')
 
-        html += '</div>'
-        return html
+        parts.append('</div>')
+        return ''.join(parts)
     
-    def create_excel_report(self, meetings: List[Dict], excel_path: str = 'trump_meetings.xlsx') -> str:
+    def create_excel_report(self, meetings: List[Dict], excel_path: str = 'trump_meetings.xlsx',
+                            stats: Dict[str, Counter] = None) -> str:
         """
         Create Excel spreadsheet with meeting data and dashboard (regenerates fresh each time with all meetings)
+        Dashboard counts come from stats, as returned by get_stats(); when not given
+        they are queried for exactly the meetings passed in, so both sheets agree
         Returns the path to the Excel file
         """
+        if stats is None:
+            stats = self.get_stats([meeting['id'] for meeting in meetings])
+
         # Always create a fresh workbook
         wb = Workbook()
 
@@ -1568,11 +2172,11 @@ class TrumpMeetingsTracker:
         ]
 
         # Write headers with styling
-        for col, header in enumerate(headers, start=1):
-            cell = data_sheet.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="0F1F2E", end_color="0F1F2E", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+        data_sheet.append(headers)
+        for cell in data_sheet[1]:
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGNMENT
 
         # Set column widths
         data_sheet.column_dimensions['A'].width = 15  # Date
@@ -1588,14 +2192,6 @@ class TrumpMeetingsTracker:
         data_sheet.column_dimensions['K'].width = 60  # Source URLs
         data_sheet.column_dimensions['L'].width = 40  # Notes
 
-        next_row = 2
-
-        # Collect statistics while adding data
-        industries = []
-        confidence_levels = []
-        companies = []
-        locations = []
-
         # Add all meetings
         for meeting in meetings:
             # Parse source URLs
@@ -1625,67 +2221,52 @@ class TrumpMeetingsTracker:
                     meeting.get('notes', '')
                 ]
 
-                # Collect stats
-                industries.append(attendee.get('primary_industry', 'Unknown'))
-                conf_level = attendee.get('confidence_level') or 'unknown'
-                confidence_levels.append(conf_level.upper() if conf_level else 'UNKNOWN')
-                companies.append(attendee.get('company', 'Unknown'))
-                locations.append(meeting.get('location', 'Unknown'))
-
-                for col, value in enumerate(row_data, start=1):
-                    cell = data_sheet.cell(row=next_row, column=col, value=value)
-
-                    # Color code by confidence level
-                    confidence_val = attendee.get('confidence_level') or ''
-                    confidence_lower = confidence_val.lower() if confidence_val else ''
-                    if confidence_lower == 'high':
-                        cell.fill = PatternFill(start_color="D1FAE5", end_color="D1FAE5", fill_type="solid")
-                    elif confidence_lower == 'medium':
-                        cell.fill = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
-                    elif confidence_lower == 'low':
-                        cell.fill = PatternFill(start_color="FEE2E2", end_color="FEE2E2", fill_type="solid")
+                data_sheet.append(row_data)
 
-                next_row += 1
+                # Color code by confidence level
+                fill = FILL_BY_CONF.get(confidence.lower())
+                if fill is not None:
+                    for cell in data_sheet[data_sheet.max_row]:
+                        cell.fill = fill
 
         # ===== CREATE DASHBOARD =====
+        industry_counts = stats['industries']
+        confidence_counts = stats['confidence_levels']
+        company_counts = stats['companies']
+        location_counts = stats['locations']
+        total_attendees = sum(company_counts.values())
+
         # Title
-        dashboard['A1'] = 'Trump Meetings Tracker - Dashboard'
-        dashboard['A1'].font = Font(bold=True, size=16, color="0F1F2E")
+        _put(dashboard, 1, 1, 'Trump Meetings Tracker - Dashboard', font=BOLD_16)
         dashboard.merge_cells('A1:D1')
 
         # Summary Stats
-        dashboard['A3'] = 'Summary Statistics'
-        dashboard['A3'].font = Font(bold=True, size=14, color="0F1F2E")
-
-        dashboard['A4'] = 'Total Meetings:'
-        dashboard['B4'] = len(meetings)
-        dashboard['A5'] = 'Total Attendees:'
-        dashboard['B5'] = len(companies)
-        dashboard['A6'] = 'Unique Companies:'
-        dashboard['B6'] = len(set(companies))
-        dashboard['A7'] = 'Date Range:'
+        _put(dashboard, 3, 1, 'Summary Statistics', font=BOLD_14)
+
+        date_range = None
         if meetings:
             dates = [m.get('date', '') for m in meetings if m.get('date')]
-            dashboard['B7'] = f"{min(dates) if dates else 'N/A'} to {max(dates) if dates else 'N/A'}"
+            date_range = f"{min(dates) if dates else 'N/A'} to {max(dates) if dates else 'N/A'}"
 
-        # Style summary stats
-        for row in range(4, 8):
-            dashboard[f'A{row}'].font = Font(bold=True)
-            dashboard[f'B{row}'].fill = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
+        summary_rows = [
+            ('Total Meetings:', len(meetings)),
+            ('Total Attendees:', total_attendees),
+            ('Unique Companies:', len(company_counts)),
+            ('Date Range:', date_range),
+        ]
+        for row, (label, value) in enumerate(summary_rows, start=4):
+            _put(dashboard, row, 1, label, font=BOLD)
+            _put(dashboard, row, 2, value, fill=FILL_SUMMARY)
 
         # Industry Breakdown
-        dashboard['A10'] = 'Meetings by Industry'
-        dashboard['A10'].font = Font(bold=True, size=12, color="0F1F2E")
+        _put(dashboard, 10, 1, 'Meetings by Industry', font=BOLD_12)
 
-        industry_counts = Counter(industries)
-        dashboard['A11'] = 'Industry'
-        dashboard['B11'] = 'Count'
-        dashboard['A11'].font = Font(bold=True)
-        dashboard['B11'].font = Font(bold=True)
+        _put(dashboard, 11, 1, 'Industry', font=BOLD)
+        _put(dashboard, 11, 2, 'Count', font=BOLD)
 
         for idx, (industry, count) in enumerate(industry_counts.most_common(10), start=12):
-            dashboard[f'A{idx}'] = industry
-            dashboard[f'B{idx}'] = count
+            _put(dashboard, idx, 1, industry)
+            _put(dashboard, idx, 2, count)
 
         # Create bar chart for industries
         industry_chart = BarChart()
@@ -1702,20 +2283,14 @@ class TrumpMeetingsTracker:
         dashboard.add_chart(industry_chart, "D10")
 
         # Confidence Level Breakdown
-        dashboard['A25'] = 'Confidence Level Distribution'
-        dashboard['A25'].font = Font(bold=True, size=12, color="0F1F2E")
+        _put(dashboard, 25, 1, 'Confidence Level Distribution', font=BOLD_12)
 
-        confidence_counts = Counter(confidence_levels)
-        dashboard['A26'] = 'Confidence'
-        dashboard['B26'] = 'Count'
-        dashboard['A26'].font = Font(bold=True)
-        dashboard['B26'].font = Font(bold=True)
+        _put(dashboard, 26, 1, 'Confidence', font=BOLD)
+        _put(dashboard, 26, 2, 'Count', font=BOLD)
 
-        conf_row = 27
-        for confidence in ['HIGH', 'MEDIUM', 'LOW']:
-            dashboard[f'A{conf_row}'] = confidence
-            dashboard[f'B{conf_row}'] = confidence_counts.get(confidence, 0)
-            conf_row += 1
+        for conf_row, confidence in enumerate(['HIGH', 'MEDIUM', 'LOW'], start=27):
+            _put(dashboard, conf_row, 1, confidence)
+            _put(dashboard, conf_row, 2, confidence_counts.get(confidence, 0))
 
         # Create pie chart for confidence
         pie_chart = PieChart()
@@ -1729,32 +2304,24 @@ class TrumpMeetingsTracker:
         dashboard.add_chart(pie_chart, "D25")
 
         # Top Companies
-        dashboard['A35'] = 'Top 10 Companies'
-        dashboard['A35'].font = Font(bold=True, size=12, color="0F1F2E")
+        _put(dashboard, 35, 1, 'Top 10 Companies', font=BOLD_12)
 
-        company_counts = Counter(companies)
-        dashboard['A36'] = 'Company'
-        dashboard['B36'] = 'Meetings'
-        dashboard['A36'].font = Font(bold=True)
-        dashboard['B36'].font = Font(bold=True)
+        _put(dashboard, 36, 1, 'Company', font=BOLD)
+        _put(dashboard, 36, 2, 'Meetings', font=BOLD)
 
         for idx, (company, count) in enumerate(company_counts.most_common(10), start=37):
-            dashboard[f'A{idx}'] = company
-            dashboard[f'B{idx}'] = count
+            _put(dashboard, idx, 1, company)
+            _put(dashboard, idx, 2, count)
 
         # Location Breakdown
-        dashboard['D35'] = 'Meetings by Location'
-        dashboard['D35'].font = Font(bold=True, size=12, color="0F1F2E")
+        _put(dashboard, 35, 4, 'Meetings by Location', font=BOLD_12)
 
-        location_counts = Counter(locations)
-        dashboard['D36'] = 'Location'
-        dashboard['E36'] = 'Count'
-        dashboard['D36'].font = Font(bold=True)
-        dashboard['E36'].font = Font(bold=True)
+        _put(dashboard, 36, 4, 'Location', font=BOLD)
+        _put(dashboard, 36, 5, 'Count', font=BOLD)
 
         for idx, (location, count) in enumerate(location_counts.most_common(), start=37):
-            dashboard[f'D{idx}'] = location
-            dashboard[f'E{idx}'] = count
+            _put(dashboard, idx, 4, location)
+            _put(dashboard, idx, 5, count)
 
         # Set column widths for dashboard
         dashboard.column_dimensions['A'].width = 25
@@ -1765,7 +2332,7 @@ class TrumpMeetingsTracker:
 
         # Save the workbook
         wb.save(excel_path)
-        print(f"📊 Excel report created with {len(companies)} meeting entries and dashboard: {excel_path}")
+        print(f"📊 Excel report created with {total_attendees} meeting entries and dashboard: {excel_path}")
 
         return excel_path
 
@@ -1780,20 +2347,17 @@ class TrumpMeetingsTracker:
             return False
         
         try:
-            sg = SendGridAPIClient(sendgrid_api_key)
-
-            message = Mail(
-                from_email=sender_email,
-                to_emails=recipients,
-                subject=subject,
-                html_content=html_content
-            )
+            sg = _get_sendgrid_client(sendgrid_api_key)
 
             # Attach Excel file if provided
+            attachment = None
             if attachment_path and os.path.exists(attachment_path):
                 with open(attachment_path, 'rb') as f:
-                    file_data = f.read()
-                    encoded_file = base64.b64encode(file_data).decode()
+                    if os.fstat(f.fileno()).st_size >= ATTACHMENT_MMAP_THRESHOLD:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            encoded_file = base64.b64encode(mapped).decode('ascii')
+                    else:
+                        encoded_file = base64.b64encode(f.read()).decode('ascii')
 
                 attachment = Attachment(
                     FileContent(encoded_file),
@@ -1801,18 +2365,37 @@ class TrumpMeetingsTracker:
                     FileType('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
                     Disposition('attachment')
                 )
-                message.attachment = attachment
                 print(f"📎 Attached Excel file: {os.path.basename(attachment_path)}")
 
-            response = sg.send(message)
-            
-            if response.status_code == 202:
+            def send_batch(batch_recipients: List[str]):
+                message = Mail(
+                    from_email=sender_email,
+                    to_emails=batch_recipients,
+                    subject=subject,
+                    html_content=html_content
+                )
+                if attachment is not None:
+                    message.attachment = attachment
+                return sg.send(message)
+
+            # Split large recipient lists to stay under SendGrid's per-message limit
+            batches = [
+                recipients[i:i + SENDGRID_MAX_RECIPIENTS]
+                for i in range(0, len(recipients), SENDGRID_MAX_RECIPIENTS)
+            ]
+            if len(batches) == 1:
+                responses = [send_batch(batches[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+                    responses = list(executor.map(send_batch, batches))
+
+            status_codes = [response.status_code for response in responses]
+            if all(code == 202 for code in status_codes):
                 print(f"✅ Email sent successfully to {len(recipients)} recipient(s)")
-                return True
             else:
-                print(f"⚠️ Email sent with status code: {response.status_code}")
-                return True
-                
+                print(f"⚠️ Email sent with status code(s): {', '.join(str(code) for code in status_codes)}")
+            return True
+
         except Exception as e:
             print(f"❌ Error sending email: {str(e)}")
             return False
@@ -1823,22 +2406,22 @@ class TrumpMeetingsTracker:
         print("TRUMP MEETINGS TRACKER - ENHANCED VERSION")
         print("=" * 60)
         print()
+
+        # One timestamp for the whole run, so the email body and subject agree
+        now = datetime.now()
         
         # Search for meetings
         meetings = self.search_all_sources(days_back)
         
         # Save new meetings
-        saved_count = 0
-        for meeting in meetings:
-            meeting_id = self.save_meeting(meeting)
-            if meeting_id > 0:
-                saved_count += 1
+        meeting_ids = self.save_meetings_batch(meetings)
+        saved_count = sum(1 for meeting_id in meeting_ids if meeting_id > 0)
         
         print()
         print(f"💾 Saved {saved_count} new meeting(s) to database")
         
         # Get meetings from last run
-        since_date = (datetime.now() - timedelta(days=days_back)).isoformat()
+        since_date = (now - timedelta(days=days_back)).isoformat()
         recent_meetings = self.get_new_meetings(since_date)
         
         print(f"📊 Total meetings in database from last {days_back} days: {len(recent_meetings)}")
@@ -1846,7 +2429,7 @@ class TrumpMeetingsTracker:
         
         # Generate and send email
         if recent_meetings:
-            html_content = self.generate_email_html(recent_meetings)
+            html_content = self.generate_email_html(recent_meetings, now.strftime('%B %d, %Y at %I:%M %p'))
 
             # Create Excel report with ALL meetings from database (deduplicated)
             all_meetings = self.get_all_meetings()
@@ -1857,15 +2440,15 @@ class TrumpMeetingsTracker:
             recipients = [email.strip() for email in recipients_str.split(',') if email.strip()]
 
             if recipients:
-                subject = f"Trump Meetings Update - {len(recent_meetings)} Meeting(s) ({datetime.now().strftime('%b %d, %Y')})"
+                subject = f"Trump Meetings Update - {len(recent_meetings)} Meeting(s) ({now.strftime('%b %d, %Y')})"
                 self.send_email(recipients, subject, html_content, attachment_path=excel_path)
             else:
                 print("⚠️ No email recipients configured. Set EMAIL_RECIPIENTS environment variable.")
                 print("\n📧 Generated email saved for preview")
 
                 # Save email to file for preview
-                with open('email_preview.html', 'w') as f:
-                    f.write(html_content)
+                with open('email_preview.html', 'wb', buffering=0) as f:
+                    f.write(html_content.encode('utf-8'))
                 print("   Saved to: email_preview.html")
                 print(f"   Excel report saved to: {excel_path}")
         else:
@@ -1910,19 +2493,21 @@ class TrumpMeetingsTracker:
 
 def main():
     """Entry point for script"""
-    tracker = TrumpMeetingsTracker()
-    
-    # Check if we should add test data
-    if os.environ.get('ADD_TEST_DATA') == 'true':
-        print("📝 Adding test meetings...")
-        tracker.add_test_meeting("Andy Jassy", "CEO", "Amazon", "January 3, 2026")
-        tracker.add_test_meeting("Doug McMillon", "CEO", "Walmart", "January 4, 2026")
-        tracker.add_test_meeting("Mary Barra", "CEO", "GM", "January 5, 2026")
-        print()
-    
-    # Default: search last 30 days (CEO meetings are infrequent)
-    days_back = int(os.environ.get('DAYS_BACK', '30'))
-    tracker.run(days_back=days_back)
+    # Closing the tracker checkpoints the WAL so the .db artifact is complete
+    with TrumpMeetingsTracker() as tracker:
+        # Check if we should add test data
+        if os.environ.get('ADD_TEST_DATA') == 'true':
+            print("📝 Adding test meetings...")
+            # Committed together as one write
+            with tracker.transaction():
+                tracker.add_test_meeting("Andy Jassy", "CEO", "Amazon", "January 3, 2026")
+                tracker.add_test_meeting("Doug McMillon", "CEO", "Walmart", "January 4, 2026")
+                tracker.add_test_meeting("Mary Barra", "CEO", "GM", "January 5, 2026")
+            print()
+
+        # Default: search last 30 days (CEO meetings are infrequent)
+        days_back = int(os.environ.get('DAYS_BACK', '30'))
+        tracker.run(days_back=days_back)
 
 
 if __name__ == "__main__":